@@ -4,12 +4,17 @@ import logging
 import sys
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 
 if TYPE_CHECKING:
     from structlog.types import Processor
 
 
+def _orjson_dumps_str(obj: Any, **kwargs: Any) -> str:
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def configure_logging(
     level: str = "INFO",
     log_format: str = "console",
@@ -41,11 +46,21 @@ def configure_logging(
 
     if log_format == "json":
         # Production: JSON output for log aggregation
+        # orjson renders bytes, so write straight to the binary stream when there is one;
+        # replaced streams (pytest capture, StringIO, some MCP hosts) only take str
+        buffer = getattr(sys.stderr, "buffer", None)
         processors: list[Processor] = [
             *shared_processors,
             structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(
+                serializer=orjson.dumps if buffer is not None else _orjson_dumps_str
+            ),
         ]
+        logger_factory: Any = (
+            structlog.BytesLoggerFactory(file=buffer)
+            if buffer is not None
+            else structlog.PrintLoggerFactory(file=sys.stderr)
+        )
     else:
         # Development: Colored console output
         processors = [
@@ -55,12 +70,13 @@ def configure_logging(
                 exception_formatter=structlog.dev.plain_traceback,
             ),
         ]
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stderr)
 
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
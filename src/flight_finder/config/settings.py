@@ -55,6 +55,12 @@ class Settings(BaseSettings):
         le=3600,
         description="Cache TTL in seconds (0-3600)",
     )
+    cache_max_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        le=43200,
+        description="Upper bound for per-search adaptive cache TTLs in seconds (0-43200)",
+    )
     cache_max_size: int = Field(
         default=1000,
         ge=100,
@@ -1,6 +1,9 @@
 """Flight entity with business rules and validation."""
 
+from collections.abc import Mapping
 from datetime import datetime
+from functools import cached_property
+from typing import Any, Self
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
@@ -98,6 +101,25 @@ class Flight(BaseModel):
         """Calculate total flight duration in hours."""
         return self.duration_minutes / 60.0
 
+    @cached_property
+    def dedup_key(self) -> tuple[str, str, str, datetime, datetime]:
+        """Route, airline and 30-minute departure/arrival buckets, computed once."""
+        dep = self.departure_time
+        arr = self.arrival_time
+        return (
+            self.origin.code,
+            self.destination.code,
+            self.airline,
+            dep.replace(minute=(dep.minute // 30) * 30, second=0, microsecond=0),
+            arr.replace(minute=(arr.minute // 30) * 30, second=0, microsecond=0),
+        )
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the flight, dropping the cached dedup_key so updates recompute it."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("dedup_key", None)
+        return copied
+
     def __str__(self) -> str:
         """Format as readable string."""
         stops_text = "non-stop" if self.is_non_stop else f"{self.stops} stop{'s' if self.stops > 1 else ''}"
@@ -1,6 +1,7 @@
 """Cabin class value object."""
 
 from enum import Enum
+from functools import cached_property
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -17,6 +18,11 @@ class CabinClassType(str, Enum):
         return self.value.replace("_", " ").title()
 
 
+_PREMIUM_CLASSES = frozenset(
+    {CabinClassType.PREMIUM_ECONOMY, CabinClassType.BUSINESS, CabinClassType.FIRST}
+)
+
+
 class CabinClass(BaseModel):
     """Immutable cabin class value object.
 
@@ -44,11 +50,7 @@ class CabinClass(BaseModel):
         """Hash for use in sets/dicts."""
         return hash(self.class_type)
 
-    @property
+    @cached_property
     def is_premium(self) -> bool:
         """Check if this is a premium cabin class."""
-        return self.class_type in (
-            CabinClassType.PREMIUM_ECONOMY,
-            CabinClassType.BUSINESS,
-            CabinClassType.FIRST
-        )
+        return self.class_type in _PREMIUM_CLASSES
@@ -1,6 +1,7 @@
 """Date range value object for flexible date searches."""
 
 from datetime import date, timedelta
+from functools import cached_property
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
@@ -44,7 +45,7 @@ class DateRange(BaseModel):
         """Format as 'YYYY-MM-DD to YYYY-MM-DD'."""
         return f"{self.start_date} to {self.end_date}"
 
-    @property
+    @cached_property
     def duration_days(self) -> int:
         """Calculate the number of days in the range."""
         return (self.end_date - self.start_date).days + 1
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import random
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 import structlog
 
 from flight_finder.infrastructure.http.retry_config import DEFAULT_RETRY_CONFIG, RetryConfig
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 DEFAULT_USER_AGENTS: tuple[str, ...] = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -27,6 +31,11 @@ DEFAULT_USER_AGENTS: tuple[str, ...] = (
 @dataclass
 class AsyncHTTPClient:
     timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_connections: int = 32
+    max_keepalive_connections: int = 16
+    keepalive_expiry: float = 30.0
+    http2: bool = True
     retry_config: RetryConfig = field(default_factory=lambda: DEFAULT_RETRY_CONFIG)
     user_agents: tuple[str, ...] = DEFAULT_USER_AGENTS
     _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
@@ -46,7 +55,15 @@ class AsyncHTTPClient:
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                http2=self.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            )
         return self._client
 
     async def _request_with_retry(
@@ -140,6 +157,17 @@ class AsyncHTTPClient:
     ) -> httpx.Response:
         return await self._request_with_retry("GET", url, params=params, headers=headers)
 
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        response = await self.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def post(
         self,
         url: str,
@@ -150,6 +178,17 @@ class AsyncHTTPClient:
     ) -> httpx.Response:
         return await self._request_with_retry("POST", url, json=json, data=data, headers=headers)
 
+    async def post_json(
+        self,
+        url: str,
+        *,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        response = await self.post(url, json=json, headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def close(self) -> None:
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
@@ -9,11 +9,15 @@ from flight_finder.domain.errors.domain_errors import ProviderError
 from flight_finder.infrastructure.cache.cache_key_generator import generate_cache_key
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from flight_finder.domain.entities.flight import Flight
     from flight_finder.domain.entities.search_criteria import SearchCriteria
     from flight_finder.domain.protocols.flight_provider import IFlightProvider
     from flight_finder.infrastructure.cache.in_memory_cache import InMemoryCache
 
+    TTLPolicy = Callable[[SearchCriteria, list[Flight]], int]
+
 logger = structlog.get_logger()
 
 
@@ -28,10 +32,13 @@ class CacheDecorator:
         provider: IFlightProvider,
         cache: InMemoryCache,
         ttl_seconds: int | None = None,
+        ttl_policy: TTLPolicy | None = None,
     ) -> None:
         self._provider = provider
         self._cache = cache
         self._ttl_seconds = ttl_seconds
+        # Per-search TTL from the provider, used instead of ttl_seconds when given
+        self._ttl_policy = ttl_policy
         self._logger = logger.bind(
             component="cache_decorator",
             provider=provider.provider_name,
@@ -64,15 +71,21 @@ class CacheDecorator:
 
         match result:
             case Ok(flights):
+                ttl_seconds = (
+                    self._ttl_policy(criteria, flights)
+                    if self._ttl_policy is not None
+                    else self._ttl_seconds
+                )
                 await self._cache.set(
                     cache_key,
                     flights,
-                    ttl_seconds=self._ttl_seconds,
+                    ttl_seconds=ttl_seconds,
                 )
                 self._logger.info(
                     "cache_stored",
                     key=cache_key,
                     flight_count=len(flights),
+                    ttl_seconds=ttl_seconds,
                 )
             case Err(error):
                 self._logger.debug(
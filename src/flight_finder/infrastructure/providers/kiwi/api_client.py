@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import structlog
 
@@ -23,6 +24,8 @@ from .constants import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from flight_finder.domain.entities.search_criteria import SearchCriteria
     from flight_finder.infrastructure.http.async_http_client import AsyncHTTPClient
 
@@ -30,6 +33,25 @@ logger = structlog.get_logger()
 
 
 class KiwiAPIClient:
+    _CABIN_MAP: ClassVar[Mapping[CabinClassType, str]] = MappingProxyType(
+        {
+            CabinClassType.ECONOMY: CABIN_CLASS_ECONOMY,
+            CabinClassType.PREMIUM_ECONOMY: CABIN_CLASS_PREMIUM_ECONOMY,
+            CabinClassType.BUSINESS: CABIN_CLASS_BUSINESS,
+            CabinClassType.FIRST: CABIN_CLASS_FIRST,
+        }
+    )
+
+    _PARAMS_BASE: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {
+            "currency": DEFAULT_CURRENCY,
+            "locale": DEFAULT_LOCALE,
+            "market": DEFAULT_MARKET,
+            "limit": DEFAULT_LIMIT,
+            "sort": SORT_PRICE,
+        }
+    )
+
     def __init__(self, api_key: str, http_client: AsyncHTTPClient) -> None:
         self._api_key = api_key
         self._http_client = http_client
@@ -52,10 +74,7 @@ class KiwiAPIClient:
             departure_date=str(criteria.departure_date),
         )
 
-        response = await self._http_client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
+        data = await self._http_client.get_json(url, params=params, headers=headers)
 
         if not data.get("status"):
             raise ValueError(f"API error: {data.get('message', 'Unknown error')}")
@@ -75,10 +94,7 @@ class KiwiAPIClient:
             return_date=str(criteria.return_date),
         )
 
-        response = await self._http_client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
+        data = await self._http_client.get_json(url, params=params, headers=headers)
 
         if not data.get("status"):
             raise ValueError(f"API error: {data.get('message', 'Unknown error')}")
@@ -91,17 +107,17 @@ class KiwiAPIClient:
             "X-RapidAPI-Host": RAPIDAPI_HOST,
         }
 
-    def _build_oneway_params(self, criteria: SearchCriteria) -> dict[str, Any]:
+    def _build_oneway_params(
+        self,
+        criteria: SearchCriteria,
+        extra: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         params: dict[str, Any] = {
+            **self._PARAMS_BASE,
             "originSkyId": criteria.origin.code,
             "destinationSkyId": criteria.destination.code,
             "departureDate": criteria.departure_date.isoformat(),
             "adults": criteria.passengers.adults,
-            "currency": DEFAULT_CURRENCY,
-            "locale": DEFAULT_LOCALE,
-            "market": DEFAULT_MARKET,
-            "limit": DEFAULT_LIMIT,
-            "sort": SORT_PRICE,
         }
 
         if criteria.passengers.children > 0:
@@ -119,22 +135,18 @@ class KiwiAPIClient:
         elif criteria.max_stops is not None:
             params["stops"] = min(criteria.max_stops, 2)
 
+        if extra:
+            params.update(extra)
+
         return params
 
     def _build_return_params(self, criteria: SearchCriteria) -> dict[str, Any]:
-        params = self._build_oneway_params(criteria)
-
-        if criteria.return_date:
-            params["returnDate"] = criteria.return_date.isoformat()
-
-        return params
+        if criteria.return_date is None:
+            return self._build_oneway_params(criteria)
+        return self._build_oneway_params(
+            criteria, extra={"returnDate": criteria.return_date.isoformat()}
+        )
 
-    @staticmethod
-    def _map_cabin_class(cabin_class: CabinClass) -> str:
-        mapping = {
-            CabinClassType.ECONOMY: CABIN_CLASS_ECONOMY,
-            CabinClassType.PREMIUM_ECONOMY: CABIN_CLASS_PREMIUM_ECONOMY,
-            CabinClassType.BUSINESS: CABIN_CLASS_BUSINESS,
-            CabinClassType.FIRST: CABIN_CLASS_FIRST,
-        }
-        return mapping.get(cabin_class.class_type, CABIN_CLASS_ECONOMY)
+    @classmethod
+    def _map_cabin_class(cls, cabin_class: CabinClass) -> str:
+        return cls._CABIN_MAP.get(cabin_class.class_type, CABIN_CLASS_ECONOMY)
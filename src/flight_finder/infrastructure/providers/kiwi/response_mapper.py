@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -14,6 +15,11 @@ from flight_finder.domain.value_objects.price import Price
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=2048)
+def _make_airport(code: str, name: str | None, city: str | None) -> Airport:
+    return Airport(code=code, name=name, city=city, country=None)
+
+
 class KiwiResponseMapper:
     def __init__(self) -> None:
         self._logger = logger.bind(component="kiwi_response_mapper")
@@ -24,24 +30,27 @@ class KiwiResponseMapper:
         cabin_class: CabinClass,
     ) -> list[Flight]:
         flights: list[Flight] = []
+        append = flights.append
+        map_itinerary = self._map_itinerary
 
-        data = api_data.get("data", {})
-        itineraries = data.get("itineraries", [])
+        data = api_data.get("data") or {}
+        itineraries = data.get("itineraries") or []
 
         for itinerary in itineraries:
             try:
-                flight = self._map_itinerary(itinerary, cabin_class)
-                if flight:
-                    flights.append(flight)
+                flight = map_itinerary(itinerary, cabin_class)
             except Exception as e:
-                itinerary_id = itinerary.get("id", "unknown")
+                is_dict = isinstance(itinerary, dict)
                 self._logger.warning(
                     "failed_to_map_itinerary",
-                    itinerary_id=itinerary_id,
+                    itinerary_id=itinerary.get("id", "unknown") if is_dict else "unknown",
                     error=str(e),
                 )
                 continue
 
+            if flight:
+                append(flight)
+
         return flights
 
     def _map_itinerary(
@@ -50,111 +59,90 @@ class KiwiResponseMapper:
         cabin_class: CabinClass,
     ) -> Flight | None:
         itinerary_id = itinerary.get("id", "")
-        itinerary_type = itinerary.get("__typename", "")
 
-        price_data = itinerary.get("price", {})
-        raw_amount = price_data.get("amount")
+        price_data = itinerary.get("price")
+        raw_amount = price_data.get("amount") if price_data else None
         if raw_amount is None:
             raise ValueError("No price amount")
 
-        amount = Decimal(str(raw_amount))
-        price = Price(amount=amount, currency="USD")
+        price = Price(amount=Decimal(str(raw_amount)), currency="USD")
 
-        # Handle both one-way (sector) and round-trip (outbound/inbound) responses
-        if itinerary_type == "ItineraryReturn" or "outbound" in itinerary:
-            sector_segments = self._get_outbound_segments(itinerary)
+        # Round-trip responses carry "outbound"; one-way responses carry "sector"
+        if itinerary.get("__typename") == "ItineraryReturn" or "outbound" in itinerary:
+            sector = itinerary.get("outbound")
         else:
-            # One-way: use sector
-            sector = itinerary.get("sector", {})
-            sector_segments = sector.get("sectorSegments", [])
+            sector = itinerary.get("sector")
+        sector_segments = sector.get("sectorSegments") if sector else None
 
         if not sector_segments:
             raise ValueError("No sector segments")
 
-        first_segment_data = sector_segments[0].get("segment", {})
-        last_segment_data = sector_segments[-1].get("segment", {})
-
-        source = first_segment_data.get("source", {})
-        destination = last_segment_data.get("destination", {})
-
-        origin_airport = self._extract_airport(source)
-        destination_airport = self._extract_airport(destination)
-
-        departure_time = self._parse_timestamp(source)
-        arrival_time = self._parse_timestamp(destination)
+        first_segment = sector_segments[0].get("segment") or {}
+        last_segment = sector_segments[-1].get("segment") or {}
 
-        carrier = first_segment_data.get("carrier", {})
-        airline_code = carrier.get("code", "XX")
-        airline_name = carrier.get("name")
-        flight_number = first_segment_data.get("code")
+        source = first_segment.get("source") or {}
+        destination = last_segment.get("destination") or {}
 
-        stops = len(sector_segments) - 1
+        carrier = first_segment.get("carrier")
+        airline_code = carrier.get("code") if carrier else None
+        airline_name = carrier.get("name") if carrier else None
 
-        booking_url = self._extract_booking_url(itinerary)
+        booking_url = None
+        booking_options = itinerary.get("bookingOptions")
+        edges = booking_options.get("edges") if booking_options else None
+        if edges:
+            node = edges[0].get("node")
+            booking_url = node.get("bookingUrl") if node else None
 
         return Flight(
             id=f"kiwi_{itinerary_id}",
-            origin=origin_airport,
-            destination=destination_airport,
-            departure_time=departure_time,
-            arrival_time=arrival_time,
+            origin=self._extract_airport(source),
+            destination=self._extract_airport(destination),
+            departure_time=self._parse_timestamp(source),
+            arrival_time=self._parse_timestamp(destination),
             price=price,
             cabin_class=cabin_class,
-            stops=stops,
-            airline=airline_code if airline_code else "XX",
+            stops=len(sector_segments) - 1,
+            airline=airline_code or "XX",
             airline_name=airline_name,
-            flight_number=flight_number,
+            flight_number=first_segment.get("code"),
             booking_url=booking_url,
         )
 
-    def _get_outbound_segments(self, itinerary: dict[str, Any]) -> list[dict[str, Any]]:
-        """Extract sector segments from outbound (round-trip response)."""
-        outbound = itinerary.get("outbound", {})
-        return outbound.get("sectorSegments", [])
-
-    def _extract_airport(self, location_data: dict[str, Any]) -> Airport:
-        station = location_data.get("station", {})
-        code = station.get("code", "XXX")
-        name = station.get("name", "Unknown")
+    @staticmethod
+    def _extract_airport(location_data: dict[str, Any]) -> Airport:
+        station = location_data.get("station")
+        if not station:
+            return _make_airport("XXX", "Unknown", "Unknown")
 
-        city_data = station.get("city", {})
-        city = city_data.get("name", "Unknown")
+        code = station.get("code")
+        city_data = station.get("city")
 
-        if not code or len(code) != 3 or not code.isalpha():
+        if not code or len(code) != 3 or not (code.isascii() and code.isalpha()):
             code = "XXX"
+        elif not code.isupper():
+            code = code.upper()
 
-        return Airport(
-            code=code.upper(),
-            name=name,
-            city=city,
-            country=None,
+        return _make_airport(
+            code,
+            station.get("name", "Unknown"),
+            city_data.get("name", "Unknown") if city_data else "Unknown",
         )
 
-    def _parse_timestamp(self, location_data: dict[str, Any]) -> datetime:
+    @staticmethod
+    def _parse_timestamp(location_data: dict[str, Any]) -> datetime:
         utc_time = location_data.get("utcTimeIso")
         if utc_time:
             try:
-                timestamp_str = utc_time.replace("Z", "+00:00")
-                return datetime.fromisoformat(timestamp_str)
+                return datetime.fromisoformat(utc_time)
             except ValueError:
                 pass
 
         local_time = location_data.get("localTime")
         if local_time:
             try:
-                dt = datetime.fromisoformat(local_time)
-                return dt.replace(tzinfo=timezone.utc)
+                return datetime.fromisoformat(local_time).replace(tzinfo=timezone.utc)
             except ValueError:
                 pass
 
         return datetime.now(timezone.utc)
-
-    def _extract_booking_url(self, itinerary: dict[str, Any]) -> str | None:
-        booking_options = itinerary.get("bookingOptions", {})
-        edges = booking_options.get("edges", [])
-
-        if edges:
-            first_option = edges[0].get("node", {})
-            return first_option.get("bookingUrl")
-
-        return None
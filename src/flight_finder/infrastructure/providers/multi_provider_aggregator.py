@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+_TIME_THRESHOLD = timedelta(minutes=30)
+_PRICE_TOLERANCE = Decimal("0.05")
+
 
 class MultiProviderAggregator:
     """Aggregates flight search results from multiple providers.
@@ -109,13 +112,18 @@ class MultiProviderAggregator:
             return flights
 
         unique: list[Flight] = []
-        seen_signatures: set[str] = set()
+        seen_signatures: set[tuple[str, str, str, datetime, datetime]] = set()
+        # Similar flights always share route and airline, so only those are compared
+        by_route: dict[tuple[str, str, str], list[Flight]] = {}
 
         for flight in flights:
-            signature = self._generate_signature(flight)
+            signature = flight.dedup_key
+            candidates = by_route.setdefault(
+                (flight.origin.code, flight.destination.code, flight.airline), []
+            )
 
             if signature in seen_signatures:
-                if self._is_duplicate(flight, unique):
+                if self._is_duplicate(flight, candidates):
                     self._logger.debug(
                         "duplicate_flight_skipped",
                         flight_id=flight.id,
@@ -124,6 +132,7 @@ class MultiProviderAggregator:
                     continue
 
             unique.append(flight)
+            candidates.append(flight)
             seen_signatures.add(signature)
 
         removed_count = len(flights) - len(unique)
@@ -137,24 +146,6 @@ class MultiProviderAggregator:
 
         return unique
 
-    @staticmethod
-    def _generate_signature(flight: Flight) -> str:
-        dep_rounded = flight.departure_time.replace(
-            minute=(flight.departure_time.minute // 30) * 30,
-            second=0,
-            microsecond=0,
-        )
-        arr_rounded = flight.arrival_time.replace(
-            minute=(flight.arrival_time.minute // 30) * 30,
-            second=0,
-            microsecond=0,
-        )
-
-        return (
-            f"{flight.origin.code}-{flight.destination.code}-"
-            f"{flight.airline}-{dep_rounded.isoformat()}-{arr_rounded.isoformat()}"
-        )
-
     def _is_duplicate(self, flight: Flight, existing: list[Flight]) -> bool:
         for existing_flight in existing:
             if self._are_similar(flight, existing_flight):
@@ -171,17 +162,15 @@ class MultiProviderAggregator:
         if f1.airline != f2.airline:
             return False
 
-        time_threshold = timedelta(minutes=30)
-        if abs(f1.departure_time - f2.departure_time) > time_threshold:
+        if abs(f1.departure_time - f2.departure_time) > _TIME_THRESHOLD:
             return False
-        if abs(f1.arrival_time - f2.arrival_time) > time_threshold:
+        if abs(f1.arrival_time - f2.arrival_time) > _TIME_THRESHOLD:
             return False
 
         price_diff = abs(f1.price.amount - f2.price.amount)
         avg_price = (f1.price.amount + f2.price.amount) / 2
-        price_threshold = avg_price * Decimal("0.05")
 
-        if price_diff > price_threshold:
+        if price_diff > avg_price * _PRICE_TOLERANCE:
             return False
 
         return True
@@ -57,17 +57,19 @@ class ProviderFactory:
 
         rate_limiter = RateLimiter(rate=1, per=3.0)
 
-        provider: IFlightProvider = SkyscannerProvider(
+        skyscanner = SkyscannerProvider(
             api_key=self._settings.skyscanner_api_key,
             http_client=self._http_client,
             rate_limiter=rate_limiter,
+            max_cache_ttl_seconds=self._settings.cache_max_ttl_seconds,
         )
+        provider: IFlightProvider = skyscanner
 
-        if with_cache:
+        if with_cache and self._settings.cache_enabled:
             provider = CacheDecorator(
                 provider=provider,
                 cache=self._cache,
-                ttl_seconds=self._settings.cache_ttl_seconds,
+                ttl_policy=skyscanner.cache_ttl,
             )
 
         self._logger.info("skyscanner_provider_created")
@@ -89,7 +91,7 @@ class ProviderFactory:
             rate_limiter=rate_limiter,
         )
 
-        if with_cache:
+        if with_cache and self._settings.cache_enabled:
             provider = CacheDecorator(
                 provider=provider,
                 cache=self._cache,
@@ -115,7 +117,7 @@ class ProviderFactory:
             rate_limiter=rate_limiter,
         )
 
-        if with_cache:
+        if with_cache and self._settings.cache_enabled:
             provider = CacheDecorator(
                 provider=provider,
                 cache=self._cache,
@@ -141,7 +143,7 @@ class ProviderFactory:
             rate_limiter=rate_limiter,
         )
 
-        if with_cache:
+        if with_cache and self._settings.cache_enabled:
             provider = CacheDecorator(
                 provider=provider,
                 cache=self._cache,
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import structlog
 
+from flight_finder.domain.common.result import Err, Result
+from flight_finder.domain.errors.domain_errors import ProviderError
+
 if TYPE_CHECKING:
+    from flight_finder.domain.entities.flight import Flight
+    from flight_finder.domain.entities.search_criteria import SearchCriteria
     from flight_finder.domain.protocols.flight_provider import IFlightProvider
 
 logger = structlog.get_logger()
@@ -27,6 +33,7 @@ class ProviderRegistry:
 
     def __init__(self) -> None:
         self._providers: dict[str, ProviderMetadata] = {}
+        self._sorted_enabled: list[IFlightProvider] | None = None
         self._logger = logger.bind(component="provider_registry")
 
     def register(
@@ -48,6 +55,7 @@ class ProviderRegistry:
             enabled=enabled,
             weight=weight,
         )
+        self._sorted_enabled = None
 
         self._logger.info(
             "provider_registered",
@@ -67,32 +75,63 @@ class ProviderRegistry:
         return [m.provider for m in self._providers.values() if m.enabled]
 
     def get_by_priority(self, limit: int | None = None) -> list[IFlightProvider]:
-        sorted_metadata = sorted(
-            [m for m in self._providers.values() if m.enabled],
-            key=lambda m: m.priority,
-            reverse=True,
-        )
-
-        providers = [m.provider for m in sorted_metadata]
+        if self._sorted_enabled is None:
+            sorted_metadata = sorted(
+                [m for m in self._providers.values() if m.enabled],
+                key=lambda m: m.priority,
+                reverse=True,
+            )
+            self._sorted_enabled = [m.provider for m in sorted_metadata]
 
         if limit:
-            return providers[:limit]
+            return self._sorted_enabled[:limit]
+
+        return list(self._sorted_enabled)
+
+    async def search_all(
+        self,
+        criteria: SearchCriteria,
+    ) -> dict[str, Result[list[Flight], ProviderError]]:
+        """Search all enabled providers concurrently, keyed by provider name."""
+        providers = self.get_by_priority()
+        outcomes = await asyncio.gather(
+            *(p.search(criteria) for p in providers),
+            return_exceptions=True,
+        )
 
-        return providers
+        results: dict[str, Result[list[Flight], ProviderError]] = {}
+        for provider, outcome in zip(providers, outcomes, strict=True):
+            name = provider.provider_name
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                self._logger.error("provider_search_raised", name=name, error=str(outcome))
+                outcome = Err(ProviderError(provider=name, message=str(outcome), original=outcome))
+            results[name] = outcome
+
+        return results
 
     def enable(self, name: str) -> None:
-        if name in self._providers:
+        try:
             self._providers[name].enabled = True
-            self._logger.info("provider_enabled", name=name)
+        except KeyError:
+            return
+        self._sorted_enabled = None
+        self._logger.info("provider_enabled", name=name)
 
     def disable(self, name: str) -> None:
-        if name in self._providers:
+        try:
             self._providers[name].enabled = False
-            self._logger.info("provider_disabled", name=name)
+        except KeyError:
+            return
+        self._sorted_enabled = None
+        self._logger.info("provider_disabled", name=name)
 
     def is_enabled(self, name: str) -> bool:
-        metadata = self._providers.get(name)
-        return metadata.enabled if metadata else False
+        try:
+            return self._providers[name].enabled
+        except KeyError:
+            return False
 
     def count_enabled(self) -> int:
         return sum(1 for m in self._providers.values() if m.enabled)
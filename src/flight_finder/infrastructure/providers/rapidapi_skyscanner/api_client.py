@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import structlog
 
@@ -17,12 +19,16 @@ from .constants import (
     LIVE_SEARCH_CREATE_PATH,
     LIVE_SEARCH_POLL_PATH,
     MAX_POLL_ATTEMPTS,
-    POLL_INTERVAL_SECONDS,
+    POLL_BACKOFF_BASE_SECONDS,
+    POLL_BACKOFF_CAP_SECONDS,
+    RATE_LIMIT_REQUESTS_PER_WINDOW,
     STATUS_COMPLETE,
     STATUS_IN_PROGRESS,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from flight_finder.domain.entities.search_criteria import SearchCriteria
     from flight_finder.infrastructure.http.async_http_client import AsyncHTTPClient
 
@@ -36,22 +42,36 @@ class SessionResponse:
 
 
 class RapidAPISkyscannerClient:
+    _CABIN_MAP: ClassVar[Mapping[CabinClassType, str]] = MappingProxyType(
+        {
+            CabinClassType.ECONOMY: CABIN_CLASS_MAPPING["ECONOMY"],
+            CabinClassType.PREMIUM_ECONOMY: CABIN_CLASS_MAPPING["PREMIUM_ECONOMY"],
+            CabinClassType.BUSINESS: CABIN_CLASS_MAPPING["BUSINESS"],
+            CabinClassType.FIRST: CABIN_CLASS_MAPPING["FIRST"],
+        }
+    )
+
+    _SESSION_URL = f"{API_BASE_URL}{LIVE_SEARCH_CREATE_PATH}"
+    _POLL_URL = f"{API_BASE_URL}{LIVE_SEARCH_POLL_PATH}"
+
+    # Children are sent as age 8; PassengerConfig caps children at 8
+    _CHILD_AGES: tuple[tuple[int, ...], ...] = tuple((8,) * n for n in range(9))
+
     def __init__(self, api_key: str, http_client: AsyncHTTPClient) -> None:
         self._api_key = api_key
         self._http_client = http_client
-        self._logger = logger.bind(component="rapidapi_skyscanner_client")
-
-    def _build_headers(self) -> dict[str, str]:
-        return {
-            "X-RapidAPI-Key": self._api_key,
+        self._headers = {
+            "X-RapidAPI-Key": api_key,
             "X-RapidAPI-Host": API_HOST,
             "Content-Type": "application/json",
         }
+        # Upstream allows this many requests per window; queue locally instead of hitting 429s
+        self._gate = asyncio.Semaphore(RATE_LIMIT_REQUESTS_PER_WINDOW)
+        self._logger = logger.bind(component="rapidapi_skyscanner_client")
 
     async def create_session(self, criteria: SearchCriteria) -> SessionResponse:
-        url = f"{API_BASE_URL}{LIVE_SEARCH_CREATE_PATH}"
+        url = self._SESSION_URL
         payload = self._build_session_payload(criteria)
-        headers = self._build_headers()
 
         self._logger.info(
             "creating_session",
@@ -59,22 +79,19 @@ class RapidAPISkyscannerClient:
             destination=criteria.destination.code,
         )
 
-        response = await self._http_client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
+        async with self._gate:
+            data = await self._http_client.post_json(url, json=payload, headers=self._headers)
         return SessionResponse(
             session_token=data.get("sessionToken", ""),
             status=data.get("status", ""),
         )
 
     async def poll_results(self, session_token: str) -> dict[str, Any]:
-        url = f"{API_BASE_URL}{LIVE_SEARCH_POLL_PATH.format(session_token=session_token)}"
-        headers = self._build_headers()
+        url = self._POLL_URL.format(session_token=session_token)
 
         for attempt in range(MAX_POLL_ATTEMPTS):
             if attempt > 0:
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                await asyncio.sleep(self._poll_delay(attempt))
 
             self._logger.debug(
                 "polling_results",
@@ -82,10 +99,8 @@ class RapidAPISkyscannerClient:
                 max_attempts=MAX_POLL_ATTEMPTS,
             )
 
-            response = await self._http_client.get(url, headers=headers)
-            response.raise_for_status()
-
-            data = response.json()
+            async with self._gate:
+                data = await self._http_client.get_json(url, headers=self._headers)
             status = data.get("status", "")
 
             if status == STATUS_COMPLETE:
@@ -99,6 +114,12 @@ class RapidAPISkyscannerClient:
             f"Polling timeout: Results not ready after {MAX_POLL_ATTEMPTS} attempts"
         )
 
+    @staticmethod
+    def _poll_delay(attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        delay = min(POLL_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), POLL_BACKOFF_CAP_SECONDS)
+        return random.uniform(0, delay)
+
     def _build_session_payload(self, criteria: SearchCriteria) -> dict[str, Any]:
         query_legs = [
             {
@@ -132,17 +153,11 @@ class RapidAPISkyscannerClient:
                 "currency": DEFAULT_CURRENCY,
                 "queryLegs": query_legs,
                 "adults": criteria.passengers.adults,
-                "childrenAges": [8] * criteria.passengers.children,
+                "childrenAges": self._CHILD_AGES[criteria.passengers.children],
                 "cabinClass": self._map_cabin_class(criteria.cabin_class),
             }
         }
 
-    @staticmethod
-    def _map_cabin_class(cabin_class: CabinClass) -> str:
-        mapping = {
-            CabinClassType.ECONOMY: CABIN_CLASS_MAPPING["ECONOMY"],
-            CabinClassType.PREMIUM_ECONOMY: CABIN_CLASS_MAPPING["PREMIUM_ECONOMY"],
-            CabinClassType.BUSINESS: CABIN_CLASS_MAPPING["BUSINESS"],
-            CabinClassType.FIRST: CABIN_CLASS_MAPPING["FIRST"],
-        }
-        return mapping.get(cabin_class.class_type, CABIN_CLASS_MAPPING["ECONOMY"])
+    @classmethod
+    def _map_cabin_class(cls, cabin_class: CabinClass) -> str:
+        return cls._CABIN_MAP.get(cabin_class.class_type, CABIN_CLASS_MAPPING["ECONOMY"])
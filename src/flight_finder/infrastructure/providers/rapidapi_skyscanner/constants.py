@@ -10,8 +10,9 @@ BROWSE_DATES_PATH = "/flights/browse/browseDates"
 LIVE_SEARCH_CREATE_PATH = "/flights/live/search/create"
 LIVE_SEARCH_POLL_PATH = "/flights/live/search/poll/{session_token}"
 
-MAX_POLL_ATTEMPTS = 10
-POLL_INTERVAL_SECONDS = 2.0
+MAX_POLL_ATTEMPTS = 15
+POLL_BACKOFF_BASE_SECONDS = 0.5
+POLL_BACKOFF_CAP_SECONDS = 4.0
 
 RATE_LIMIT_REQUESTS_PER_WINDOW = 1
 RATE_LIMIT_WINDOW_SECONDS = 3.0
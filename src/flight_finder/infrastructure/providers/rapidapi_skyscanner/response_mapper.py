@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -11,6 +11,9 @@ from flight_finder.domain.value_objects.airport import Airport
 from flight_finder.domain.value_objects.cabin_class import CabinClass
 from flight_finder.domain.value_objects.price import Price
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = structlog.get_logger()
 
 
@@ -34,25 +37,35 @@ class RapidAPIResponseMapper:
         carriers = results.get("carriers", {})
         segments_map = results.get("segments", {})
 
+        # Bound once here rather than re-resolved per itinerary
+        legs_get = legs.get
+        places_get = places.get
+        carriers_get = carriers.get
+        segments_get = segments_map.get
+        airport_cache: dict[str, Airport] = {}
+        map_itinerary = self._map_itinerary
+        append = flights.append
+
         for itinerary_id, itinerary in itineraries.items():
             try:
-                flight = self._map_itinerary(
-                    itinerary_id,
-                    itinerary,
-                    legs,
-                    places,
-                    carriers,
-                    segments_map,
-                    cabin_class,
+                append(
+                    map_itinerary(
+                        itinerary_id,
+                        itinerary,
+                        legs_get,
+                        places_get,
+                        carriers_get,
+                        segments_get,
+                        airport_cache,
+                        cabin_class,
+                    )
                 )
-                flights.append(flight)
             except Exception as e:
                 self._logger.warning(
                     "failed_to_map_itinerary",
                     itinerary_id=itinerary_id,
                     error=str(e),
                 )
-                continue
 
         return flights
 
@@ -60,10 +73,11 @@ class RapidAPIResponseMapper:
         self,
         itinerary_id: str,
         itinerary: dict[str, Any],
-        legs: dict[str, Any],
-        places: dict[str, Any],
-        carriers: dict[str, Any],
-        segments_map: dict[str, Any],
+        legs_get: Callable[..., Any],
+        places_get: Callable[..., Any],
+        carriers_get: Callable[..., Any],
+        segments_get: Callable[..., Any],
+        airport_cache: dict[str, Airport],
         cabin_class: CabinClass,
     ) -> Flight:
         pricing_options = itinerary.get("pricingOptions", [])
@@ -75,11 +89,17 @@ class RapidAPIResponseMapper:
         if raw_amount is None:
             raise ValueError("No price amount")
 
-        amount_str = str(raw_amount)
-        if "." not in amount_str and len(amount_str) > 2:
-            amount = Decimal(amount_str) / 100
+        # Whole amounts of three or more digits are in minor units (cents)
+        if isinstance(raw_amount, int):
+            amount = Decimal(raw_amount)
+            if raw_amount >= 100:
+                amount = amount.scaleb(-2)
+        elif isinstance(raw_amount, str):
+            amount = Decimal(raw_amount)
+            if "." not in raw_amount and len(raw_amount) > 2:
+                amount = amount.scaleb(-2)
         else:
-            amount = Decimal(amount_str)
+            amount = Decimal(str(raw_amount))
 
         price = Price(
             amount=amount,
@@ -91,7 +111,7 @@ class RapidAPIResponseMapper:
             raise ValueError("No legs in itinerary")
 
         leg_id = leg_ids[0]
-        leg = legs.get(leg_id)
+        leg = legs_get(leg_id)
         if not leg:
             raise ValueError(f"Leg not found: {leg_id}")
 
@@ -100,10 +120,10 @@ class RapidAPIResponseMapper:
             raise ValueError("No segments in leg")
 
         first_segment_id = segment_ids[0]
-        first_segment = segments_map.get(first_segment_id, {})
+        first_segment = segments_get(first_segment_id, {})
 
         carrier_id = first_segment.get("marketingCarrierId") or first_segment.get("operatingCarrierId")
-        carrier = carriers.get(str(carrier_id), {}) if carrier_id else {}
+        carrier = carriers_get(str(carrier_id), {}) if carrier_id else {}
 
         origin_id = leg.get("originPlaceId", "")
         destination_id = leg.get("destinationPlaceId", "")
@@ -119,8 +139,8 @@ class RapidAPIResponseMapper:
 
         return Flight(
             id=f"rapidapi_{itinerary_id}",
-            origin=self._resolve_airport(origin_id, places),
-            destination=self._resolve_airport(destination_id, places),
+            origin=self._resolve_airport(origin_id, places_get, airport_cache),
+            destination=self._resolve_airport(destination_id, places_get, airport_cache),
             departure_time=departure_time,
             arrival_time=arrival_time,
             price=price,
@@ -132,8 +152,16 @@ class RapidAPIResponseMapper:
             flight_number=first_segment.get("marketingFlightNumber"),
         )
 
-    def _resolve_airport(self, place_id: str, places: dict[str, Any]) -> Airport:
-        place = places.get(place_id, {})
+    def _resolve_airport(
+        self,
+        place_id: str,
+        places_get: Callable[..., Any],
+        cache: dict[str, Airport],
+    ) -> Airport:
+        if (airport := cache.get(place_id)) is not None:
+            return airport
+
+        place = places_get(place_id, {})
         iata = place.get("iata", "")
 
         if not iata and place_id:
@@ -142,28 +170,33 @@ class RapidAPIResponseMapper:
         if not iata or len(iata) != 3 or not iata.isalpha():
             iata = "XXX"
 
-        return Airport(
+        airport = Airport(
             code=iata,
             name=place.get("name", "Unknown"),
             city=place.get("name", "Unknown"),
             country=place.get("countryName", "US"),
         )
+        cache[place_id] = airport
+        return airport
 
     def _parse_timestamp(self, timestamp_data: Any) -> datetime:
         if isinstance(timestamp_data, str):
-            timestamp_str = timestamp_data.replace("Z", "+00:00")
+            # fromisoformat accepts a trailing "Z" since Python 3.11
             try:
-                return datetime.fromisoformat(timestamp_str)
+                return datetime.fromisoformat(timestamp_data)
             except ValueError:
                 pass
 
         if isinstance(timestamp_data, dict):
-            year = timestamp_data.get("year", 2026)
-            month = timestamp_data.get("month", 1)
-            day = timestamp_data.get("day", 1)
-            hour = timestamp_data.get("hour", 0)
-            minute = timestamp_data.get("minute", 0)
-            second = timestamp_data.get("second", 0)
-            return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
+            get = timestamp_data.get
+            return datetime(
+                get("year", 2026),
+                get("month", 1),
+                get("day", 1),
+                get("hour", 0),
+                get("minute", 0),
+                get("second", 0),
+                tzinfo=timezone.utc,
+            )
 
         return datetime.now(timezone.utc)
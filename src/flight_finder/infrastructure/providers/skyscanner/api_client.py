@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import structlog
 
@@ -12,18 +14,27 @@ from .constants import (
     API_POLL_PATH_TEMPLATE,
     API_SESSION_CREATE_PATH,
     MAX_POLL_ATTEMPTS,
-    POLL_INTERVAL_SECONDS,
+    POLL_BACKOFF_BASE_SECONDS,
+    POLL_BACKOFF_CAP_SECONDS,
+    RATE_LIMIT_REQUESTS_PER_WINDOW,
     STATUS_COMPLETE,
+    STATUS_FAILED,
     STATUS_IN_PROGRESS,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from flight_finder.domain.entities.search_criteria import SearchCriteria
     from flight_finder.infrastructure.http.async_http_client import AsyncHTTPClient
 
 logger = structlog.get_logger()
 
 
+class SearchFailedError(ValueError):
+    """Skyscanner reported the search itself as failed, not a transport error."""
+
+
 @dataclass
 class SessionResponse:
     session_token: str
@@ -31,18 +42,36 @@ class SessionResponse:
 
 
 class SkyscannerAPIClient:
+    _CABIN_MAP: ClassVar[Mapping[CabinClassType, str]] = MappingProxyType(
+        {
+            CabinClassType.ECONOMY: "CABIN_CLASS_ECONOMY",
+            CabinClassType.PREMIUM_ECONOMY: "CABIN_CLASS_PREMIUM_ECONOMY",
+            CabinClassType.BUSINESS: "CABIN_CLASS_BUSINESS",
+            CabinClassType.FIRST: "CABIN_CLASS_FIRST",
+        }
+    )
+
+    _SESSION_URL = f"{API_BASE_URL}{API_SESSION_CREATE_PATH}"
+    _POLL_URL = f"{API_BASE_URL}{API_POLL_PATH_TEMPLATE}"
+
+    # Children are sent as age 8; PassengerConfig caps children at 8
+    _CHILD_AGES: tuple[tuple[int, ...], ...] = tuple((8,) * n for n in range(9))
+
     def __init__(self, api_key: str, http_client: AsyncHTTPClient) -> None:
         self._api_key = api_key
         self._http_client = http_client
+        self._session_headers = {
+            "X-API-Key": api_key,
+            "Content-Type": "application/json",
+        }
+        self._poll_headers = {"X-API-Key": api_key}
+        # Upstream allows this many requests per window; queue locally instead of hitting 429s
+        self._gate = asyncio.Semaphore(RATE_LIMIT_REQUESTS_PER_WINDOW)
         self._logger = logger.bind(component="skyscanner_api_client")
 
     async def create_session(self, criteria: SearchCriteria) -> SessionResponse:
-        url = f"{API_BASE_URL}{API_SESSION_CREATE_PATH}"
+        url = self._SESSION_URL
         payload = self._build_session_payload(criteria)
-        headers = {
-            "X-API-Key": self._api_key,
-            "Content-Type": "application/json",
-        }
 
         self._logger.info(
             "creating_session",
@@ -50,22 +79,19 @@ class SkyscannerAPIClient:
             destination=criteria.destination.code,
         )
 
-        response = await self._http_client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
+        async with self._gate:
+            data = await self._http_client.post_json(url, json=payload, headers=self._session_headers)
         return SessionResponse(
             session_token=data["sessionToken"],
             status=data.get("status", ""),
         )
 
     async def poll_results(self, session_token: str) -> dict[str, Any]:
-        url = f"{API_BASE_URL}{API_POLL_PATH_TEMPLATE.format(session_token=session_token)}"
-        headers = {"X-API-Key": self._api_key}
+        url = self._POLL_URL.format(session_token=session_token)
 
         for attempt in range(MAX_POLL_ATTEMPTS):
             if attempt > 0:
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                await asyncio.sleep(self._poll_delay(attempt))
 
             self._logger.debug(
                 "polling_results",
@@ -73,16 +99,17 @@ class SkyscannerAPIClient:
                 max_attempts=MAX_POLL_ATTEMPTS,
             )
 
-            response = await self._http_client.get(url, headers=headers)
-            response.raise_for_status()
-
-            data = response.json()
+            async with self._gate:
+                data = await self._http_client.get_json(url, headers=self._poll_headers)
             status = data.get("status", "")
 
             if status == STATUS_COMPLETE:
                 self._logger.info("polling_complete", attempt=attempt + 1)
                 return data
 
+            if status == STATUS_FAILED:
+                raise SearchFailedError(f"Unexpected status: {status}")
+
             if status not in (STATUS_IN_PROGRESS, ""):
                 raise ValueError(f"Unexpected status: {status}")
 
@@ -90,6 +117,12 @@ class SkyscannerAPIClient:
             f"Polling timeout: Results not ready after {MAX_POLL_ATTEMPTS} attempts"
         )
 
+    @staticmethod
+    def _poll_delay(attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        delay = min(POLL_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), POLL_BACKOFF_CAP_SECONDS)
+        return random.uniform(0, delay)
+
     def _build_session_payload(self, criteria: SearchCriteria) -> dict[str, Any]:
         query_legs = [
             {
@@ -123,17 +156,11 @@ class SkyscannerAPIClient:
                 "currency": "USD",
                 "queryLegs": query_legs,
                 "adults": criteria.passengers.adults,
-                "childrenAges": [8] * criteria.passengers.children,
+                "childrenAges": self._CHILD_AGES[criteria.passengers.children],
                 "cabinClass": self._map_cabin_class(criteria.cabin_class),
             }
         }
 
-    @staticmethod
-    def _map_cabin_class(cabin_class: CabinClass) -> str:
-        mapping = {
-            CabinClassType.ECONOMY: "CABIN_CLASS_ECONOMY",
-            CabinClassType.PREMIUM_ECONOMY: "CABIN_CLASS_PREMIUM_ECONOMY",
-            CabinClassType.BUSINESS: "CABIN_CLASS_BUSINESS",
-            CabinClassType.FIRST: "CABIN_CLASS_FIRST",
-        }
-        return mapping.get(cabin_class.class_type, "CABIN_CLASS_ECONOMY")
+    @classmethod
+    def _map_cabin_class(cls, cabin_class: CabinClass) -> str:
+        return cls._CABIN_MAP.get(cabin_class.class_type, "CABIN_CLASS_ECONOMY")
@@ -4,13 +4,20 @@ API_BASE_URL = "https://partners.api.skyscanner.net/apiservices/v3"
 API_SESSION_CREATE_PATH = "/flights/live/search/create"
 API_POLL_PATH_TEMPLATE = "/flights/live/search/poll/{session_token}"
 
-MAX_POLL_ATTEMPTS = 10
-POLL_INTERVAL_SECONDS = 2.0
+MAX_POLL_ATTEMPTS = 15
+POLL_BACKOFF_BASE_SECONDS = 0.5
+POLL_BACKOFF_CAP_SECONDS = 4.0
 POLL_TIMEOUT_SECONDS = 20.0
 
 RATE_LIMIT_REQUESTS_PER_WINDOW = 1
 RATE_LIMIT_WINDOW_SECONDS = 3.0
 
+SEARCH_CACHE_TTL_SAME_DAY_SECONDS = 120
+SEARCH_CACHE_TTL_WEEK_SECONDS = 600
+SEARCH_CACHE_TTL_MONTH_SECONDS = 3600
+SEARCH_CACHE_TTL_FAR_SECONDS = 43200
+SEARCH_CACHE_EMPTY_TTL_SECONDS = 30
+
 SCRAPE_BASE_URL = "https://www.skyscanner.com"
 SCRAPE_TIMEOUT_MS = 30000
 
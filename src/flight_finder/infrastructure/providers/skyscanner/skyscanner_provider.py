@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
 from typing import TYPE_CHECKING
 
 from flight_finder.domain.entities.flight import Flight
 from flight_finder.domain.errors.domain_errors import ProviderError
 from flight_finder.infrastructure.providers.base_provider import BaseFlightProvider
 from .api_client import SkyscannerAPIClient
+from .constants import (
+    SEARCH_CACHE_EMPTY_TTL_SECONDS,
+    SEARCH_CACHE_TTL_FAR_SECONDS,
+    SEARCH_CACHE_TTL_MONTH_SECONDS,
+    SEARCH_CACHE_TTL_SAME_DAY_SECONDS,
+    SEARCH_CACHE_TTL_WEEK_SECONDS,
+)
 from .response_mapper import SkyscannerResponseMapper
 
 if TYPE_CHECKING:
@@ -13,6 +24,16 @@ if TYPE_CHECKING:
     from flight_finder.infrastructure.http.async_http_client import AsyncHTTPClient
     from flight_finder.infrastructure.http.rate_limiter import RateLimiter
 
+SearchKey = tuple[str, str, date, date | None, int, int, str]
+
+
+@dataclass
+class SearchStats:
+    """Upstream fetches started versus searches that joined one already in flight."""
+
+    fetches: int = 0
+    coalesced: int = 0
+
 
 class SkyscannerProvider(BaseFlightProvider):
     def __init__(
@@ -20,25 +41,90 @@ class SkyscannerProvider(BaseFlightProvider):
         api_key: str,
         http_client: AsyncHTTPClient,
         rate_limiter: RateLimiter,
+        max_cache_ttl_seconds: int = SEARCH_CACHE_TTL_FAR_SECONDS,
     ) -> None:
         super().__init__(http_client, rate_limiter)
         self._api_client = SkyscannerAPIClient(api_key, http_client)
         self._mapper = SkyscannerResponseMapper()
+        self._inflight: dict[SearchKey, asyncio.Future[tuple[Flight, ...]]] = {}
+        self._fetches = 0
+        self._coalesced = 0
+        self._max_cache_ttl_seconds = max_cache_ttl_seconds
 
     @property
     def provider_name(self) -> str:
         return "skyscanner"
 
+    def get_stats(self) -> SearchStats:
+        return SearchStats(fetches=self._fetches, coalesced=self._coalesced)
+
+    def cache_ttl(self, criteria: SearchCriteria, flights: list[Flight]) -> int:
+        """CacheDecorator TTL policy; empty results expire quickly so new availability shows."""
+        if not flights:
+            ttl = SEARCH_CACHE_EMPTY_TTL_SECONDS
+        else:
+            ttl = self._derive_ttl(criteria.departure_date)
+        return min(ttl, self._max_cache_ttl_seconds)
+
     async def _perform_search(self, criteria: SearchCriteria) -> list[Flight]:
+        # Response caching is CacheDecorator's job; this only coalesces identical searches
+        key = self._search_key(criteria)
+        fetch = self._inflight.get(key)
+        if fetch is None:
+            self._fetches += 1
+            fetch = asyncio.ensure_future(self._fetch(criteria))
+            self._inflight[key] = fetch
+            fetch.add_done_callback(partial(self._fetch_done, key))
+        else:
+            self._coalesced += 1
+            self._logger.debug("search_coalesced", origin=key[0], destination=key[1])
+
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        flights = await asyncio.shield(fetch)
+        return self._apply_filters(list(flights), criteria)
+
+    def _fetch_done(self, key: SearchKey, fetch: asyncio.Future[tuple[Flight, ...]]) -> None:
+        # Retrieve the exception so it isn't reported as unhandled when every caller was cancelled
+        if not fetch.cancelled():
+            fetch.exception()
+        self._inflight.pop(key, None)
+
+    async def _fetch(self, criteria: SearchCriteria) -> tuple[Flight, ...]:
         session = await self._api_client.create_session(criteria)
         results = await self._api_client.poll_results(session.session_token)
-        flights = self._mapper.map_api_response(results, criteria.cabin_class)
-        flights = self._apply_filters(flights, criteria)
-        return flights
+        mapped = self._mapper.map_api_response(results, criteria.cabin_class)
+        # Fetched unfiltered so coalesced callers can apply their own stop filters,
+        # and pre-sorted so each only needs an order-preserving filter
+        return tuple(sorted(mapped, key=lambda f: f.price.amount))
 
     def _map_error(self, error: Exception) -> ProviderError:
         return self._map_http_error(error)
 
+    @staticmethod
+    def _derive_ttl(departure_date: date) -> int:
+        """Fares churn near departure, so cache close-in searches for less time."""
+        days_out = (departure_date - date.today()).days
+        if days_out <= 0:
+            return SEARCH_CACHE_TTL_SAME_DAY_SECONDS
+        if days_out <= 7:
+            return SEARCH_CACHE_TTL_WEEK_SECONDS
+        if days_out <= 30:
+            return SEARCH_CACHE_TTL_MONTH_SECONDS
+        return SEARCH_CACHE_TTL_FAR_SECONDS
+
+    @staticmethod
+    def _search_key(criteria: SearchCriteria) -> SearchKey:
+        """Key on exactly the fields sent in the session payload."""
+        return (
+            criteria.origin.code,
+            criteria.destination.code,
+            criteria.departure_date,
+            criteria.return_date,
+            criteria.passengers.adults,
+            criteria.passengers.children,
+            criteria.cabin_class.class_type.value,
+        )
+
     def _apply_filters(
         self,
         flights: list[Flight],
@@ -51,6 +137,4 @@ class SkyscannerProvider(BaseFlightProvider):
         elif criteria.max_stops is not None:
             filtered = [f for f in filtered if f.stops <= criteria.max_stops]
 
-        filtered.sort(key=lambda f: f.price.amount)
-
         return filtered
@@ -2,23 +2,104 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import date
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 
-from flight_finder.domain.common.result import Err, Ok
+from flight_finder.domain.common.result import Err
 from flight_finder.presentation.schemas.converters import (
-    flight_to_dto,
+    flight_to_dict,
     to_search_criteria_from_params,
 )
 from flight_finder.presentation.utils.error_formatter import format_error_response
 
 if TYPE_CHECKING:
+    from decimal import Decimal
+
+    from flight_finder.application.dtos.flight_dtos import FlightSearchResult
     from flight_finder.application.use_cases.search_flights import SearchFlightsUseCase
+    from flight_finder.domain.entities.flight import Flight
+
+logger = structlog.get_logger(handler="search")
+
+# Flight lists longer than this are encoded in a worker thread
+_OFFLOAD_ENCODE_THRESHOLD = 50
 
-logger = structlog.get_logger()
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Encode a response with orjson; Decimal and other leftovers go through str()."""
+    return orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
+# Layout of a successful search response, matching OPT_INDENT_2 output
+_SUCCESS_RESPONSE = (
+    b'{\n  "success": true,\n  "summary": {\n    "total_flights": %d,\n'
+    b'    "search_duration_ms": %b,\n    "providers_used": %b,\n'
+    b'    "cache_hit": %b,\n    "price_range": {\n      "min": %b,\n'
+    b'      "max": %b\n    }\n  },\n  "flights": %b\n}'
+)
+
+
+def _dumps_nested(value: Any, indent: bytes = b"  ") -> bytes:
+    """Encode a value that sits inside _SUCCESS_RESPONSE at the given indent."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2).replace(
+        b"\n", b"\n" + indent
+    )
+
+
+def _encode_flights(
+    flights: list[Flight],
+) -> tuple[bytearray, Decimal | None, Decimal | None]:
+    """Stream flights into a JSON array, tracking the price range on the way.
+
+    Each flight is encoded as soon as its dict is built, so no list of
+    per-flight dicts is held alongside the output buffer.
+    """
+    buf = bytearray(b"[")
+    separator = b"\n    "
+    min_price = max_price = None
+    for flight in flights:
+        amount = flight.price.amount
+        if min_price is None or amount < min_price:
+            min_price = amount
+        if max_price is None or amount > max_price:
+            max_price = amount
+        buf += separator
+        buf += _dumps_nested(flight_to_dict(flight), b"    ")
+        separator = b",\n    "
+    buf += b"\n  ]"
+    return buf, min_price, max_price
+
+
+def _render_success(
+    search_result: FlightSearchResult,
+    min_price: Decimal | None,
+    max_price: Decimal | None,
+    encoded_flights: bytes | bytearray,
+) -> str:
+    """Fill _SUCCESS_RESPONSE without building the summary as a dict."""
+    return (
+        _SUCCESS_RESPONSE
+        % (
+            search_result.total_results,
+            orjson.dumps(round(search_result.search_duration_ms, 2)),
+            _dumps_nested(search_result.providers_used, b"    "),
+            b"true" if search_result.cache_hit else b"false",
+            orjson.dumps(str(min_price)) if min_price else b"null",
+            orjson.dumps(str(max_price)) if max_price else b"null",
+            encoded_flights,
+        )
+    ).decode()
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> date:
+    """Parse a YYYY-MM-DD string; agent loops repeat the same dates a lot."""
+    return date.fromisoformat(value)
 
 
 class SearchHandler:
@@ -26,7 +107,7 @@ class SearchHandler:
 
     def __init__(self, search_use_case: SearchFlightsUseCase) -> None:
         self._search_use_case = search_use_case
-        self._logger = logger.bind(handler="search")
+        self._logger = logger
 
     async def handle_search(
         self,
@@ -59,8 +140,8 @@ class SearchHandler:
             JSON string with search results or error
         """
         try:
-            parsed_departure = date.fromisoformat(departure_date)
-            parsed_return = date.fromisoformat(return_date) if return_date else None
+            parsed_departure = _parse_iso(departure_date)
+            parsed_return = _parse_iso(return_date) if return_date else None
 
             criteria = to_search_criteria_from_params(
                 origin=origin,
@@ -77,48 +158,25 @@ class SearchHandler:
 
             result = await self._search_use_case.execute(criteria)
 
-            match result:
-                case Ok(search_result):
-                    flights_dto = [flight_to_dto(f) for f in search_result.flights]
-
-                    min_price = (
-                        min(f.price.amount for f in search_result.flights)
-                        if search_result.flights
-                        else None
-                    )
-                    max_price = (
-                        max(f.price.amount for f in search_result.flights)
-                        if search_result.flights
-                        else None
-                    )
-
-                    return json.dumps(
-                        {
-                            "success": True,
-                            "summary": {
-                                "total_flights": search_result.total_results,
-                                "search_duration_ms": round(
-                                    search_result.search_duration_ms, 2
-                                ),
-                                "providers_used": search_result.providers_used,
-                                "cache_hit": search_result.cache_hit,
-                                "price_range": {
-                                    "min": str(min_price) if min_price else None,
-                                    "max": str(max_price) if max_price else None,
-                                },
-                            },
-                            "flights": [f.model_dump() for f in flights_dto],
-                        },
-                        indent=2,
-                        default=str,
-                    )
-
-                case Err(error):
-                    return format_error_response(error)
+            if isinstance(result, Err):
+                return format_error_response(result.error)
+
+            search_result = result.value
+            if not search_result.flights:
+                return _render_success(search_result, None, None, b"[]")
+
+            flights = search_result.flights
+            if len(flights) > _OFFLOAD_ENCODE_THRESHOLD:
+                encoded, min_price, max_price = await asyncio.to_thread(
+                    _encode_flights, flights
+                )
+            else:
+                encoded, min_price, max_price = _encode_flights(flights)
+            return _render_success(search_result, min_price, max_price, encoded)
 
         except ValueError as e:
             self._logger.warning("validation_error", error=str(e))
-            return json.dumps(
+            return _dumps(
                 {
                     "success": False,
                     "error": {
@@ -126,7 +184,6 @@ class SearchHandler:
                         "message": str(e),
                     },
                 },
-                indent=2,
             )
         except Exception as e:
             self._logger.exception("search_handler_error", error=str(e))
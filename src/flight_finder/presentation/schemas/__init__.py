@@ -1,6 +1,7 @@
 """Presentation layer schemas and converters."""
 
 from flight_finder.presentation.schemas.converters import (
+    flight_to_dict,
     flight_to_dto,
     to_search_criteria,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "FlightDTO",
     "PriceDTO",
     # Converters
+    "flight_to_dict",
     "flight_to_dto",
     "to_search_criteria",
 ]
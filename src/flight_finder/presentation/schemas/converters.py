@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from flight_finder.domain.entities.search_criteria import SearchCriteria
 from flight_finder.domain.value_objects.airport import Airport
@@ -15,6 +16,15 @@ from flight_finder.presentation.schemas.responses import FlightDTO, PriceDTO
 if TYPE_CHECKING:
     from flight_finder.domain.entities.flight import Flight
 
+_CABIN_MAPPING: dict[str, CabinClassType] = {
+    "economy": CabinClassType.ECONOMY,
+    "premium_economy": CabinClassType.PREMIUM_ECONOMY,
+    "premium economy": CabinClassType.PREMIUM_ECONOMY,
+    "premiumeconomy": CabinClassType.PREMIUM_ECONOMY,
+    "business": CabinClassType.BUSINESS,
+    "first": CabinClassType.FIRST,
+}
+
 
 def to_search_criteria(request: SearchFlightsRequest) -> SearchCriteria:
     """Convert SearchFlightsRequest to domain SearchCriteria.
@@ -72,11 +82,44 @@ def to_search_criteria_from_params(
     Returns:
         Domain SearchCriteria entity
     """
-    cabin_class_type = _parse_cabin_class(cabin_class)
+    return _build_criteria(
+        origin.upper(),
+        destination.upper(),
+        departure_date,
+        return_date,
+        adults,
+        children,
+        infants,
+        cabin_class,
+        max_stops,
+        non_stop_only,
+        date.today(),
+    )
+
 
+@lru_cache(maxsize=256)
+def _build_criteria(
+    origin: str,
+    destination: str,
+    departure_date: date,
+    return_date: date | None,
+    adults: int,
+    children: int,
+    infants: int,
+    cabin_class: str,
+    max_stops: int | None,
+    non_stop_only: bool,
+    _cache_day: date,
+) -> SearchCriteria:
+    """Build SearchCriteria, memoized on the full parameter tuple.
+
+    ``_cache_day`` is never read; it only keys the cache by today's date.
+    The departure-not-in-past check depends on the day, so entries must
+    not outlive the day they were validated on.
+    """
     return SearchCriteria(
-        origin=Airport(code=origin.upper()),
-        destination=Airport(code=destination.upper()),
+        origin=Airport(code=origin),
+        destination=Airport(code=destination),
         departure_date=departure_date,
         return_date=return_date,
         passengers=PassengerConfig(
@@ -84,7 +127,7 @@ def to_search_criteria_from_params(
             children=children,
             infants=infants,
         ),
-        cabin_class=CabinClass(class_type=cabin_class_type),
+        cabin_class=CabinClass(class_type=_parse_cabin_class(cabin_class)),
         max_stops=max_stops,
         non_stop_only=non_stop_only,
     )
@@ -99,14 +142,15 @@ def flight_to_dto(flight: Flight) -> FlightDTO:
     Returns:
         FlightDTO for JSON serialization
     """
-    return FlightDTO(
+    # Fields come from an already-validated Flight, so skip re-validation.
+    return FlightDTO.model_construct(
         id=flight.id,
         origin=flight.origin.code,
         destination=flight.destination.code,
         departure_time=flight.departure_time.isoformat(),
         arrival_time=flight.arrival_time.isoformat(),
         duration_minutes=flight.duration_minutes,
-        price=PriceDTO(
+        price=PriceDTO.model_construct(
             amount=str(flight.price.amount),
             currency=flight.price.currency,
         ),
@@ -120,6 +164,40 @@ def flight_to_dto(flight: Flight) -> FlightDTO:
     )
 
 
+def flight_to_dict(flight: Flight) -> dict[str, Any]:
+    """Convert domain Flight to a plain dict with the FlightDTO layout.
+
+    Used on the response path, where building and dumping a FlightDTO per
+    flight would only be thrown away after serialization.
+
+    Args:
+        flight: Domain flight entity
+
+    Returns:
+        Dict ready for orjson serialization
+    """
+    return {
+        "id": flight.id,
+        "origin": flight.origin.code,
+        "destination": flight.destination.code,
+        # orjson encodes datetimes as ISO 8601 itself, identical to isoformat()
+        "departure_time": flight.departure_time,
+        "arrival_time": flight.arrival_time,
+        "duration_minutes": flight.duration_minutes,
+        "price": {
+            "amount": str(flight.price.amount),
+            "currency": flight.price.currency,
+        },
+        "airline": flight.airline,
+        "airline_name": flight.airline_name,
+        "flight_number": flight.flight_number,
+        "cabin_class": flight.cabin_class.class_type.value,
+        "stops": flight.stops,
+        "is_non_stop": flight.is_non_stop,
+        "booking_url": flight.booking_url,
+    }
+
+
 def flights_to_dtos(flights: list[Flight]) -> list[FlightDTO]:
     """Convert list of domain Flights to FlightDTOs.
 
@@ -134,15 +212,7 @@ def flights_to_dtos(flights: list[Flight]) -> list[FlightDTO]:
 
 def _parse_cabin_class(cabin_class: str) -> CabinClassType:
     """Parse cabin class string to CabinClassType enum."""
-    normalized = cabin_class.lower().strip()
-
-    mapping = {
-        "economy": CabinClassType.ECONOMY,
-        "premium_economy": CabinClassType.PREMIUM_ECONOMY,
-        "premium economy": CabinClassType.PREMIUM_ECONOMY,
-        "premiumeconomy": CabinClassType.PREMIUM_ECONOMY,
-        "business": CabinClassType.BUSINESS,
-        "first": CabinClassType.FIRST,
-    }
-
-    return mapping.get(normalized, CabinClassType.ECONOMY)
+    parsed = _CABIN_MAPPING.get(cabin_class)
+    if parsed is not None:
+        return parsed
+    return _CABIN_MAPPING.get(cabin_class.lower().strip(), CabinClassType.ECONOMY)
@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
+
+# Normalization runs inside pydantic-core instead of a Python validator call
+IATACode = Annotated[
+    str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=3, max_length=3)
+]
+CabinClassName = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
 
 
 class PassengerCount(BaseModel):
@@ -32,33 +39,17 @@ class SearchFlightsRequest(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
-    origin: str = Field(..., min_length=3, max_length=3, description="Origin IATA code")
-    destination: str = Field(..., min_length=3, max_length=3, description="Destination IATA code")
+    origin: IATACode = Field(..., description="Origin IATA code")
+    destination: IATACode = Field(..., description="Destination IATA code")
     departure_date: date = Field(..., description="Departure date")
     return_date: date | None = Field(default=None, description="Return date for round trip")
     passengers: PassengerCount = Field(
         default_factory=PassengerCount, description="Passenger counts"
     )
-    cabin_class: str = Field(default="economy", description="Cabin class")
+    cabin_class: CabinClassName = Field(default="economy", description="Cabin class")
     max_stops: int | None = Field(default=None, ge=0, le=5, description="Maximum stops")
     non_stop_only: bool = Field(default=False, description="Only non-stop flights")
 
-    @field_validator("origin", "destination", mode="before")
-    @classmethod
-    def uppercase_iata(cls, v: str) -> str:
-        """Convert IATA codes to uppercase."""
-        if isinstance(v, str):
-            return v.upper().strip()
-        return v
-
-    @field_validator("cabin_class", mode="before")
-    @classmethod
-    def normalize_cabin_class(cls, v: str) -> str:
-        """Normalize cabin class value."""
-        if isinstance(v, str):
-            return v.lower().strip()
-        return v
-
 
 class FilterFlightsRequest(BaseModel):
     """Request schema for filtering flights."""
@@ -1,7 +1,9 @@
 """Presentation layer utilities."""
 
 from flight_finder.config import configure_logging
-from flight_finder.presentation.utils.error_formatter import format_error_response
+from flight_finder.presentation.utils.error_formatter import (
+    format_error_response,
+)
 
 __all__ = [
     "configure_logging",
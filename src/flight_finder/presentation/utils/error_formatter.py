@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from collections.abc import Callable
+from functools import partial
+from typing import Any, cast
 
+import orjson
 from pydantic import ValidationError as PydanticValidationError
 
 from flight_finder.domain.errors.domain_errors import (
@@ -15,6 +18,35 @@ from flight_finder.domain.errors.domain_errors import (
     ValidationError,
 )
 
+# Datetimes pass through to default=str so they render as str(dt) like json did
+_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+# Binds orjson.dumps and its options once
+_orjson_dumps: Callable[[Any], bytes] = partial(
+    orjson.dumps, default=str, option=_DUMPS_OPTIONS
+)
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a response as indented UTF-8 JSON."""
+    try:
+        return _orjson_dumps(payload)
+    except TypeError:
+        # orjson rejects values json accepts, such as ints beyond 64 bits
+        return json.dumps(payload, indent=2, default=str).encode()
+
+
+Builder = Callable[[Exception], dict[str, Any]]
+
+
+# Shared payload for unexpected errors; only ever serialized, never mutated
+_INTERNAL_ERROR: dict[str, Any] = {
+    "code": "INTERNAL_ERROR",
+    "message": "An unexpected error occurred",
+}
+_INTERNAL_ERROR_JSON = _dumps({"success": False, "error": _INTERNAL_ERROR}).decode()
+
 
 def format_error_response(error: Exception) -> str:
     """Format an error as a JSON response string.
@@ -25,94 +57,112 @@ def format_error_response(error: Exception) -> str:
     Returns:
         JSON string with error details
     """
-    response = _build_error_response(error)
-    return json.dumps(response, indent=2, default=str)
-
-
-def _build_error_response(error: Exception) -> dict[str, Any]:
-    """Build error response dictionary."""
-    if isinstance(error, PydanticValidationError):
-        return {
-            "success": False,
-            "error": {
-                "code": "VALIDATION_ERROR",
-                "message": "Invalid input parameters",
-                "details": _format_pydantic_errors(error),
-            },
-        }
+    builder = _resolve_builder(type(error))
+    if builder is _build_internal:
+        return _INTERNAL_ERROR_JSON
+    try:
+        return _dumps({"success": False, "error": builder(error)}).decode()
+    except (TypeError, ValueError):
+        # Called from handlers' except blocks, so encoding must never raise
+        return _INTERNAL_ERROR_JSON
+
+
+def _resolve_builder(error_type: type[Exception]) -> Builder:
+    """Find the builder for the closest registered class in the MRO, once per type."""
+    builder = _RESOLVED_BUILDERS.get(error_type)
+    if builder is None:
+        builder = next(
+            (_BUILDERS[cls] for cls in error_type.__mro__ if cls in _BUILDERS),
+            _build_internal,
+        )
+        _RESOLVED_BUILDERS[error_type] = builder
+    return builder
+
+
+def _build_pydantic(error: PydanticValidationError) -> dict[str, Any]:
+    return {
+        "code": "VALIDATION_ERROR",
+        "message": "Invalid input parameters",
+        "details": _format_pydantic_errors(error),
+    }
 
-    if isinstance(error, ValidationError):
-        return {
-            "success": False,
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "field": error.field,
-                "details": error.context,
-            },
-        }
 
-    if isinstance(error, RateLimitError):
-        return {
-            "success": False,
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "provider": error.provider,
-                "retry_after": error.retry_after,
-            },
-        }
+def _build_validation(error: ValidationError) -> dict[str, Any]:
+    return {
+        "code": error.code,
+        "message": error.message,
+        "field": error.field,
+        "details": error.context,
+    }
 
-    if isinstance(error, TimeoutError):
-        return {
-            "success": False,
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "provider": error.provider,
-                "timeout_seconds": error.timeout_seconds,
-            },
-        }
 
-    if isinstance(error, ProviderError):
-        return {
-            "success": False,
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "provider": error.provider,
-                "details": error.context,
-            },
-        }
+def _build_rate_limit(error: RateLimitError) -> dict[str, Any]:
+    return {
+        "code": error.code,
+        "message": error.message,
+        "provider": error.provider,
+        "retry_after": error.retry_after,
+    }
 
-    if isinstance(error, DomainError):
-        return {
-            "success": False,
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "details": error.context,
-            },
-        }
 
+def _build_timeout(error: TimeoutError) -> dict[str, Any]:
     return {
-        "success": False,
-        "error": {
-            "code": "INTERNAL_ERROR",
-            "message": "An unexpected error occurred",
-        },
+        "code": error.code,
+        "message": error.message,
+        "provider": error.provider,
+        "timeout_seconds": error.timeout_seconds,
     }
 
 
+def _build_provider(error: ProviderError) -> dict[str, Any]:
+    return {
+        "code": error.code,
+        "message": error.message,
+        "provider": error.provider,
+        "details": error.context,
+    }
+
+
+def _build_domain(error: DomainError) -> dict[str, Any]:
+    return {
+        "code": error.code,
+        "message": error.message,
+        "details": error.context,
+    }
+
+
+def _build_internal(_error: Exception) -> dict[str, Any]:
+    return _INTERNAL_ERROR
+
+
+# Each builder takes the class it is keyed by; _resolve_builder only pairs it with subclasses
+_BUILDERS = cast(
+    "dict[type[Exception], Builder]",
+    {
+        PydanticValidationError: _build_pydantic,
+        ValidationError: _build_validation,
+        RateLimitError: _build_rate_limit,
+        TimeoutError: _build_timeout,
+        ProviderError: _build_provider,
+        DomainError: _build_domain,
+    },
+)
+# Bounded by the number of distinct exception classes ever formatted
+_RESOLVED_BUILDERS: dict[type[Exception], Builder] = {}
+
+
 def _format_pydantic_errors(error: PydanticValidationError) -> list[dict[str, Any]]:
     """Format Pydantic validation errors."""
+    # Only loc/msg/type are used, so skip building the URL, context and input entries
     return [
         {
-            "field": ".".join(str(loc) for loc in err["loc"]),
+            "field": ".".join(map(str, err["loc"])),
             "message": err["msg"],
             "type": err["type"],
         }
-        for err in error.errors()
+        for err in error.errors(
+            include_url=False, include_context=False, include_input=False
+        )
     ]
 
 
@@ -132,4 +182,4 @@ def format_success_response(data: dict[str, Any], message: str | None = None) ->
     }
     if message:
         response["message"] = message
-    return json.dumps(response, indent=2, default=str)
+    return _dumps(response).decode()
@@ -1,17 +1,32 @@
 """Pytest configuration and shared fixtures."""
 
+import copy
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from pydantic_settings import BaseSettings
 
-# Set test environment variables before importing settings
-os.environ.setdefault("FLIGHT_FINDER_LOG_LEVEL", "DEBUG")
-os.environ.setdefault("FLIGHT_FINDER_CACHE_ENABLED", "false")
-os.environ.setdefault("FLIGHT_FINDER_DEFAULT_PROVIDER", "mock")
+_TEST_ENV = {
+    "FLIGHT_FINDER_LOG_LEVEL": "DEBUG",
+    "FLIGHT_FINDER_CACHE_ENABLED": "false",
+    "FLIGHT_FINDER_DEFAULT_PROVIDER": "mock",
+}
+
+# Set test environment variables before importing settings, keeping any overrides
+os.environ.update({k: v for k, v in _TEST_ENV.items() if k not in os.environ})
+
+_AIRPORT_CODES: Mapping[str, str] = MappingProxyType({
+    "JFK": "John F. Kennedy International Airport",
+    "LAX": "Los Angeles International Airport",
+    "LHR": "London Heathrow Airport",
+    "CDG": "Paris Charles de Gaulle Airport",
+    "SFO": "San Francisco International Airport",
+    "ORD": "O'Hare International Airport",
+})
 
 
 @pytest.fixture(scope="session")
@@ -28,7 +43,9 @@ def mock_settings() -> Generator[MagicMock, None, None]:
     # Clear the cached settings
     get_settings.cache_clear()
 
+    # Fresh mock per test so attributes a test assigns cannot leak into the next
     mock = MagicMock(spec=Settings)
+
     mock.log_level = "DEBUG"
     mock.log_format = "console"
     mock.cache_enabled = False
@@ -77,10 +94,10 @@ def test_settings() -> Generator[BaseSettings, None, None]:
     get_settings.cache_clear()
 
 
-@pytest.fixture
-def sample_flight_data() -> dict[str, Any]:
-    """Provide sample flight data for testing."""
-    return {
+@pytest.fixture(scope="session")
+def _sample_flight_data_template() -> Mapping[str, Any]:
+    """Read-only sample flight data, built once per test session."""
+    return MappingProxyType({
         "origin": "JFK",
         "destination": "LAX",
         "departure_date": "2025-06-15",
@@ -121,17 +138,16 @@ def sample_flight_data() -> dict[str, Any]:
                 "booking_url": "https://example.com/book/AA456",
             },
         ],
-    }
+    })
 
 
 @pytest.fixture
-def sample_airport_codes() -> dict[str, str]:
+def sample_flight_data(_sample_flight_data_template: Mapping[str, Any]) -> dict[str, Any]:
+    """Provide a private, mutable copy of the sample flight data."""
+    return copy.deepcopy(dict(_sample_flight_data_template))
+
+
+@pytest.fixture(scope="session")
+def sample_airport_codes() -> Mapping[str, str]:
     """Provide sample airport codes for testing."""
-    return {
-        "JFK": "John F. Kennedy International Airport",
-        "LAX": "Los Angeles International Airport",
-        "LHR": "London Heathrow Airport",
-        "CDG": "Paris Charles de Gaulle Airport",
-        "SFO": "San Francisco International Airport",
-        "ORD": "O'Hare International Airport",
-    }
+    return _AIRPORT_CODES
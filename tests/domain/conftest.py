@@ -0,0 +1,33 @@
+"""Shared fixtures for domain tests."""
+
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from flight_finder.domain.entities.flight import Flight
+from flight_finder.domain.value_objects.airport import Airport
+from flight_finder.domain.value_objects.price import Price
+
+# Value objects are frozen, so one instance of each default is shared by all flights
+_DEFAULT_FLIGHT_FIELDS: dict[str, Any] = {
+    "id": "TEST-1",
+    "origin": Airport(code="JFK"),
+    "destination": Airport(code="LAX"),
+    "departure_time": datetime(2026, 6, 1, 10, 0),
+    "arrival_time": datetime(2026, 6, 1, 14, 0),
+    "price": Price(amount=Decimal("299.99")),
+    "airline": "AA",
+}
+
+
+@pytest.fixture(scope="module")
+def flight_factory() -> Callable[..., Flight]:
+    """Build a JFK-LAX Flight, overriding only the fields a test cares about."""
+
+    def make(**overrides: Any) -> Flight:
+        return Flight(**{**_DEFAULT_FLIGHT_FIELDS, **overrides})
+
+    return make
@@ -1,8 +1,14 @@
 """Unit tests for Airport value object."""
 
 import pytest
+from pydantic import ValidationError
 from flight_finder.domain.value_objects.airport import Airport
 
+MAJOR_US_AIRPORTS = ("JFK", "LAX", "ORD", "ATL", "DFW", "DEN", "SFO", "SEA", "MIA", "LAS")
+MAJOR_INTERNATIONAL_AIRPORTS = (
+    "LHR", "CDG", "FRA", "AMS", "DXB", "SIN", "HKG", "NRT", "ICN", "SYD",
+)
+
 
 class TestAirportValidation:
     """Test Airport validation rules."""
@@ -57,7 +63,7 @@ class TestAirportValidation:
     def test_immutability(self):
         """Test that Airport is immutable."""
         airport = Airport(code="JFK")
-        with pytest.raises(Exception):  # Pydantic raises ValidationError or AttributeError
+        with pytest.raises(ValidationError):  # Frozen model rejects assignment
             airport.code = "LAX"
 
 
@@ -122,16 +128,12 @@ class TestAirportFormatting:
 class TestAirportRealWorldCodes:
     """Test real-world airport codes."""
 
-    def test_major_us_airports(self):
+    @pytest.mark.parametrize("code", MAJOR_US_AIRPORTS)
+    def test_major_us_airports(self, code):
         """Test major US airport codes."""
-        codes = ["JFK", "LAX", "ORD", "ATL", "DFW", "DEN", "SFO", "SEA", "MIA", "LAS"]
-        for code in codes:
-            airport = Airport(code=code)
-            assert airport.code == code
+        assert Airport(code=code).code == code
 
-    def test_major_international_airports(self):
+    @pytest.mark.parametrize("code", MAJOR_INTERNATIONAL_AIRPORTS)
+    def test_major_international_airports(self, code):
         """Test major international airport codes."""
-        codes = ["LHR", "CDG", "FRA", "AMS", "DXB", "SIN", "HKG", "NRT", "ICN", "SYD"]
-        for code in codes:
-            airport = Airport(code=code)
-            assert airport.code == code
+        assert Airport(code=code).code == code
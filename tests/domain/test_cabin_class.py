@@ -1,6 +1,7 @@
 """Unit tests for CabinClass value object."""
 
 import pytest
+from pydantic import ValidationError
 from flight_finder.domain.value_objects.cabin_class import CabinClass, CabinClassType
 
 
@@ -35,7 +36,7 @@ class TestCabinClassCreation:
     def test_immutability(self):
         """Test that CabinClass is immutable."""
         cabin_class = CabinClass(class_type=CabinClassType.ECONOMY)
-        with pytest.raises(Exception):  # Pydantic raises ValidationError or AttributeError
+        with pytest.raises(ValidationError):  # Frozen model rejects assignment
             cabin_class.class_type = CabinClassType.BUSINESS
 
 
@@ -1,387 +1,235 @@
 """Unit tests for Flight entity."""
 
 import pytest
+from pydantic import ValidationError
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-from flight_finder.domain.entities.flight import Flight
 from flight_finder.domain.value_objects.airport import Airport
 from flight_finder.domain.value_objects.price import Price
-from flight_finder.domain.value_objects.cabin_class import CabinClass, CabinClassType
+
+# Value objects are frozen, so tests share these instead of rebuilding them
+JFK = Airport(code="JFK")
+SFO = Airport(code="SFO")
+ORD = Airport(code="ORD")
+DEP = datetime(2026, 6, 1, 10, 0)
+ARR_4H = DEP + timedelta(hours=4)
+ARR_4H30 = DEP + timedelta(hours=4, minutes=30)
+ARR_5H30 = DEP + timedelta(hours=5, minutes=30)
+ARR_10H = DEP + timedelta(hours=10)
+AMOUNT_STD = Decimal("299.99")
+PRICE_STD = Price(amount=AMOUNT_STD)
+PRICE_349 = Price(amount=Decimal("349.99"))
+PRICE_399 = Price(amount=Decimal("399.99"))
 
 
 class TestFlightValidation:
     """Test Flight validation rules."""
 
-    def test_create_valid_flight(self):
+    def test_create_valid_flight(self, flight_factory):
         """Test creating a valid flight."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 30)
+        arrival = ARR_4H30
 
-        flight = Flight(
+        flight = flight_factory(
             id="AA100-JFK-LAX-20260601",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
             arrival_time=arrival,
-            price=Price(amount=Decimal("299.99"), currency="USD"),
-            airline="AA",
+            price=PRICE_STD,
             stops=0,
         )
 
         assert flight.id == "AA100-JFK-LAX-20260601"
         assert flight.origin.code == "JFK"
         assert flight.destination.code == "LAX"
-        assert flight.departure_time == departure
+        assert flight.departure_time == DEP
         assert flight.arrival_time == arrival
-        assert flight.price.amount == Decimal("299.99")
+        assert flight.price.amount == AMOUNT_STD
         assert flight.airline == "AA"
         assert flight.stops == 0
 
-    def test_arrival_before_departure_fails(self):
-        """Test that arrival before departure fails."""
-        departure = datetime(2026, 6, 1, 14, 0)
-        arrival = datetime(2026, 6, 1, 10, 0)
-
-        with pytest.raises(ValueError, match="must be after departure"):
-            Flight(
-                id="TEST-1",
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_time=departure,
-                arrival_time=arrival,
-                price=Price(amount=Decimal("299.99")),
-                airline="AA",
-            )
-
-    def test_arrival_equals_departure_fails(self):
-        """Test that arrival equal to departure fails."""
-        time = datetime(2026, 6, 1, 10, 0)
-
-        with pytest.raises(ValueError, match="must be after departure"):
-            Flight(
-                id="TEST-1",
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_time=time,
-                arrival_time=time,
-                price=Price(amount=Decimal("299.99")),
-                airline="AA",
-            )
-
-    def test_same_origin_destination_fails(self):
-        """Test that same origin and destination fails."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        with pytest.raises(ValueError, match="cannot be the same airport"):
-            Flight(
-                id="TEST-1",
-                origin=Airport(code="JFK"),
-                destination=Airport(code="JFK"),  # Same as origin
-                departure_time=departure,
-                arrival_time=arrival,
-                price=Price(amount=Decimal("299.99")),
-                airline="AA",
-            )
-
-    def test_duration_exceeds_24_hours_fails(self):
-        """Test that flight duration > 24 hours fails."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 3, 11, 0)  # More than 24 hours later
-
-        with pytest.raises(ValueError, match="exceeds 24 hours"):
-            Flight(
-                id="TEST-1",
-                origin=Airport(code="JFK"),
-                destination=Airport(code="SYD"),
-                departure_time=departure,
-                arrival_time=arrival,
-                price=Price(amount=Decimal("1299.99")),
-                airline="QF",
-            )
-
-    def test_invalid_stops_count_fails(self):
-        """Test that invalid stops count fails."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 20, 0)
-
-        # Negative stops
-        with pytest.raises(ValueError):
-            Flight(
-                id="TEST-1",
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_time=departure,
-                arrival_time=arrival,
-                price=Price(amount=Decimal("299.99")),
-                airline="AA",
-                stops=-1,
-            )
-
-        # Too many stops
-        with pytest.raises(ValueError):
-            Flight(
-                id="TEST-1",
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_time=departure,
-                arrival_time=arrival,
-                price=Price(amount=Decimal("299.99")),
-                airline="AA",
-                stops=6,
-            )
-
-    def test_airline_code_converted_to_uppercase(self):
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            pytest.param(
+                {
+                    "departure_time": ARR_4H,
+                    "arrival_time": DEP,
+                },
+                "must be after departure",
+                id="arrival_before_departure",
+            ),
+            pytest.param(
+                {
+                    "departure_time": DEP,
+                    "arrival_time": DEP,
+                },
+                "must be after departure",
+                id="arrival_equals_departure",
+            ),
+            pytest.param(
+                {"destination": JFK},  # Same as origin
+                "cannot be the same airport",
+                id="same_origin_destination",
+            ),
+            pytest.param(
+                {
+                    "destination": Airport(code="SYD"),
+                    "arrival_time": DEP + timedelta(hours=25),
+                },
+                "exceeds 24 hours",
+                id="duration_exceeds_24_hours",
+            ),
+            pytest.param({"stops": -1}, None, id="negative_stops"),
+            pytest.param({"stops": 6}, None, id="too_many_stops"),
+        ],
+    )
+    def test_invalid_flight_fails(self, flight_factory, overrides, match):
+        """Test that each broken business rule is rejected."""
+        with pytest.raises(ValueError, match=match):
+            flight_factory(**overrides)
+
+    def test_airline_code_converted_to_uppercase(self, flight_factory):
         """Test that airline code is converted to uppercase."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        flight = Flight(
-            id="TEST-1",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="aa",  # lowercase
-        )
+        flight = flight_factory(airline="aa")  # lowercase
 
         assert flight.airline == "AA"
 
-    def test_immutability(self):
+    def test_immutability(self, flight_factory):
         """Test that Flight is immutable."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        flight = Flight(
-            id="TEST-1",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-        )
+        flight = flight_factory()
 
-        with pytest.raises(Exception):  # Pydantic raises ValidationError or AttributeError
+        with pytest.raises(ValidationError):  # Frozen model rejects assignment
             flight.price = Price(amount=Decimal("199.99"))
 
 
 class TestFlightProperties:
     """Test Flight computed properties."""
 
-    def test_is_non_stop_true(self):
+    def test_is_non_stop_true(self, flight_factory):
         """Test is_non_stop when flight has no stops."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        flight = Flight(
-            id="TEST-1",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-            stops=0,
-        )
+        flight = flight_factory(stops=0)
 
-        assert flight.is_non_stop
-        assert flight.is_direct
+        assert flight.is_non_stop is True
+        assert flight.is_direct is True
 
-    def test_is_non_stop_false(self):
+    def test_is_non_stop_false(self, flight_factory):
         """Test is_non_stop when flight has stops."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 20, 0)
-
-        flight = Flight(
-            id="TEST-1",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
+        flight = flight_factory(
+            arrival_time=ARR_10H,
             price=Price(amount=Decimal("199.99")),
-            airline="AA",
             stops=1,
         )
 
-        assert not flight.is_non_stop
-        assert not flight.is_direct
-
-    def test_duration_minutes(self):
-        """Test duration_minutes calculation."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 15, 30)  # 5h 30m
-
-        flight = Flight(
-            id="TEST-1",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
+        assert flight.is_non_stop is False
+        assert flight.is_direct is False
+
+    @pytest.mark.parametrize(
+        "arrival,expected_minutes,expected_hours",
+        [
+            (ARR_5H30, 330, 5.5),
+            (DEP + timedelta(hours=6), 360, 6.0),
+        ],
+    )
+    def test_duration(self, flight_factory, arrival, expected_minutes, expected_hours):
+        """Test duration_minutes and duration_hours calculation."""
+        flight = flight_factory(arrival_time=arrival)
+
+        assert flight.duration_minutes == expected_minutes
+        assert flight.duration_hours == expected_hours
+
+    def test_dedup_key_buckets_times_and_is_cached(self, flight_factory):
+        """Test dedup_key floors times to 30 minutes and is computed once."""
+        flight = flight_factory(
+            destination=SFO,
+            departure_time=datetime(2026, 6, 1, 10, 44, 12),
+            arrival_time=datetime(2026, 6, 1, 16, 5),
+            price=PRICE_349,
+            airline="UA",
         )
 
-        assert flight.duration_minutes == 330  # 5.5 hours * 60
+        assert flight.dedup_key == (
+            "JFK",
+            "SFO",
+            "UA",
+            datetime(2026, 6, 1, 10, 30),
+            datetime(2026, 6, 1, 16, 0),
+        )
+        assert flight.dedup_key is flight.dedup_key
+        assert "dedup_key" not in flight.model_dump()
 
-    def test_duration_hours(self):
-        """Test duration_hours calculation."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 16, 0)  # 6 hours
+    def test_dedup_key_recomputed_after_model_copy(self, flight_factory):
+        """Test a copy with updated fields does not reuse the cached dedup_key."""
+        flight = flight_factory(airline="AA")
+        assert flight.dedup_key[2] == "AA"
 
-        flight = Flight(
-            id="TEST-1",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="SFO"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("349.99")),
-            airline="UA",
-        )
+        copied = flight.model_copy(update={"airline": "BA"})
 
-        assert flight.duration_hours == 6.0
+        assert copied.dedup_key[2] == "BA"
+        assert flight.dedup_key[2] == "AA"
 
 
 class TestFlightEquality:
     """Test Flight equality and hashing."""
 
-    def test_flights_equal_by_id(self):
+    @pytest.fixture(scope="class")
+    def flights(self, flight_factory):
+        """Two AA100 flights with different details, plus UA200."""
+        return (
+            flight_factory(id="AA100"),
+            flight_factory(
+                id="AA100",
+                origin=ORD,
+                destination=SFO,
+                price=PRICE_399,
+                airline="UA",
+            ),
+            flight_factory(id="UA200", airline="UA"),
+        )
+
+    def test_flights_equal_by_id(self, flights):
         """Test that flights are equal if IDs match."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        flight1 = Flight(
-            id="AA100",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-        )
+        aa100, aa100_other, _ = flights
+        assert aa100 == aa100_other
 
-        # Same ID, different details
-        flight2 = Flight(
-            id="AA100",
-            origin=Airport(code="ORD"),
-            destination=Airport(code="SFO"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("399.99")),
-            airline="UA",
-        )
-
-        assert flight1 == flight2
-
-    def test_flights_not_equal_different_ids(self):
+    def test_flights_not_equal_different_ids(self, flights):
         """Test that flights with different IDs are not equal."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        flight1 = Flight(
-            id="AA100",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-        )
-
-        flight2 = Flight(
-            id="AA200",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-        )
+        aa100, _, ua200 = flights
+        assert aa100 != ua200
 
-        assert flight1 != flight2
-
-    def test_flight_hashable(self):
+    def test_flight_hashable(self, flights):
         """Test that flights can be used in sets."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 14, 0)
-
-        flight1 = Flight(
-            id="AA100",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-        )
-
-        flight2 = Flight(
-            id="AA100",
-            origin=Airport(code="ORD"),
-            destination=Airport(code="SFO"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("399.99")),
-            airline="UA",
-        )
-
-        flight3 = Flight(
-            id="UA200",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="UA",
-        )
-
-        flight_set = {flight1, flight2, flight3}
-        assert len(flight_set) == 2  # flight1 and flight2 have same ID
+        flight_set = set(flights)
+        assert len(flight_set) == 2  # Both AA100 flights share an ID
 
 
 class TestFlightFormatting:
     """Test Flight string formatting."""
 
-    def test_str_format_complete(self):
-        """Test string format with all details."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 15, 30)
-
-        flight = Flight(
-            id="AA100-JFK-LAX",
-            origin=Airport(code="JFK", city="New York"),
-            destination=Airport(code="LAX", city="Los Angeles"),
-            departure_time=departure,
-            arrival_time=arrival,
-            price=Price(amount=Decimal("299.99")),
-            airline="AA",
-            flight_number="100",
-            stops=0,
+    @pytest.fixture(scope="class")
+    def complete_str(self, flight_factory):
+        """String form of a fully detailed non-stop flight."""
+        return str(
+            flight_factory(
+                id="AA100-JFK-LAX",
+                origin=Airport(code="JFK", city="New York"),
+                destination=Airport(code="LAX", city="Los Angeles"),
+                arrival_time=ARR_5H30,
+                flight_number="100",
+                stops=0,
+            )
         )
 
-        result = str(flight)
-        assert "AA" in result
-        assert "100" in result
-        assert "JFK" in result
-        assert "LAX" in result
-        assert "non-stop" in result
-        assert "USD 299.99" in result
-
-    def test_str_format_with_stops(self):
-        """Test string format with stops."""
-        departure = datetime(2026, 6, 1, 10, 0)
-        arrival = datetime(2026, 6, 1, 20, 0)
+    @pytest.mark.parametrize("needle", ["AA", "100", "JFK", "LAX", "non-stop", "USD 299.99"])
+    def test_str_format_complete(self, complete_str, needle):
+        """Test string format with all details."""
+        assert needle in complete_str
 
-        flight = Flight(
+    def test_str_format_with_stops(self, flight_factory):
+        """Test string format with stops."""
+        flight = flight_factory(
             id="AA200",
-            origin=Airport(code="JFK"),
-            destination=Airport(code="SFO"),
-            departure_time=departure,
-            arrival_time=arrival,
+            destination=SFO,
+            arrival_time=ARR_10H,
             price=Price(amount=Decimal("249.99")),
-            airline="AA",
             stops=2,
         )
 
@@ -1,6 +1,7 @@
 """Unit tests for PassengerConfig value object."""
 
 import pytest
+from pydantic import ValidationError
 from flight_finder.domain.value_objects.passenger_config import PassengerConfig
 
 
@@ -23,71 +24,53 @@ class TestPassengerConfigValidation:
         assert config.infants == 1
         assert config.total_passengers == 4
 
-    def test_zero_adults_fails(self):
-        """Test that zero adults fails."""
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=0)
-
-    def test_negative_passengers_fail(self):
-        """Test that negative passenger counts fail."""
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=-1)
-
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=1, children=-1)
-
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=1, infants=-1)
-
-    def test_too_many_adults_fails(self):
-        """Test that more than 9 adults fails."""
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=10)
-
-    def test_too_many_children_fails(self):
-        """Test that more than 8 children fails."""
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=1, children=9)
-
-    def test_too_many_infants_fails(self):
-        """Test that more than 4 infants fails."""
-        with pytest.raises(ValueError):
-            PassengerConfig(adults=5, infants=5)
-
-    def test_total_passengers_exceeds_nine_fails(self):
-        """Test that total passengers > 9 fails."""
-        with pytest.raises(ValueError, match="Total"):
-            PassengerConfig(adults=5, children=5)
-
-        with pytest.raises(ValueError, match="Total"):
-            PassengerConfig(adults=6, children=2, infants=2)
-
-    def test_infants_exceed_adults_fails(self):
-        """Test that infants cannot exceed adults (lap infant rule)."""
-        with pytest.raises(ValueError, match="infants.*cannot exceed.*adults"):
-            PassengerConfig(adults=2, infants=3)
-
-        with pytest.raises(ValueError, match="infants.*cannot exceed.*adults"):
-            PassengerConfig(adults=1, infants=2)
-
-    def test_max_valid_passengers(self):
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            pytest.param({"adults": 0}, None, id="zero_adults"),
+            pytest.param({"adults": -1}, None, id="negative_adults"),
+            pytest.param({"adults": 1, "children": -1}, None, id="negative_children"),
+            pytest.param({"adults": 1, "infants": -1}, None, id="negative_infants"),
+            pytest.param({"adults": 10}, None, id="too_many_adults"),
+            pytest.param({"adults": 1, "children": 9}, None, id="too_many_children"),
+            pytest.param({"adults": 5, "infants": 5}, None, id="too_many_infants"),
+            pytest.param({"adults": 5, "children": 5}, "Total", id="total_exceeds_nine"),
+            pytest.param(
+                {"adults": 6, "children": 2, "infants": 2}, "Total", id="total_with_infants"
+            ),
+            pytest.param(
+                {"adults": 2, "infants": 3},
+                "infants.*cannot exceed.*adults",
+                id="infants_exceed_adults",
+            ),
+            pytest.param(
+                {"adults": 1, "infants": 2},
+                "infants.*cannot exceed.*adults",
+                id="infants_exceed_single_adult",
+            ),
+        ],
+    )
+    def test_invalid_config_fails(self, kwargs, match):
+        """Test that each invalid passenger combination is rejected."""
+        with pytest.raises(ValueError, match=match):
+            PassengerConfig(**kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"adults": 9}, id="nine_adults"),
+            pytest.param({"adults": 5, "children": 4}, id="adults_and_children"),
+            pytest.param({"adults": 4, "children": 1, "infants": 4}, id="all_types"),
+        ],
+    )
+    def test_max_valid_passengers(self, kwargs):
         """Test maximum valid passenger configurations."""
-        # 9 adults
-        config = PassengerConfig(adults=9)
-        assert config.total_passengers == 9
-
-        # 5 adults, 4 children
-        config = PassengerConfig(adults=5, children=4)
-        assert config.total_passengers == 9
-
-        # 4 adults, 4 infants, 1 child
-        config = PassengerConfig(adults=4, children=1, infants=4)
-        assert config.total_passengers == 9
+        assert PassengerConfig(**kwargs).total_passengers == 9
 
     def test_immutability(self):
         """Test that PassengerConfig is immutable."""
         config = PassengerConfig(adults=2)
-        with pytest.raises(Exception):  # Pydantic raises ValidationError or AttributeError
+        with pytest.raises(ValidationError):  # Frozen model rejects assignment
             config.adults = 3
 
 
@@ -102,61 +85,43 @@ class TestPassengerConfigProperties:
     def test_has_children_or_infants_false(self):
         """Test has_children_or_infants when false."""
         config = PassengerConfig(adults=3)
-        assert not config.has_children_or_infants
+        assert config.has_children_or_infants is False
 
     def test_has_children_or_infants_with_children(self):
         """Test has_children_or_infants with children."""
         config = PassengerConfig(adults=2, children=2)
-        assert config.has_children_or_infants
+        assert config.has_children_or_infants is True
 
     def test_has_children_or_infants_with_infants(self):
         """Test has_children_or_infants with infants."""
         config = PassengerConfig(adults=2, infants=1)
-        assert config.has_children_or_infants
+        assert config.has_children_or_infants is True
 
     def test_has_children_or_infants_with_both(self):
         """Test has_children_or_infants with both."""
         config = PassengerConfig(adults=2, children=1, infants=1)
-        assert config.has_children_or_infants
+        assert config.has_children_or_infants is True
 
 
 class TestPassengerConfigFormatting:
     """Test PassengerConfig string formatting."""
 
-    def test_str_single_adult(self):
-        """Test string format with single adult."""
-        config = PassengerConfig(adults=1)
-        assert str(config) == "1 adult"
-
-    def test_str_multiple_adults(self):
-        """Test string format with multiple adults."""
-        config = PassengerConfig(adults=3)
-        assert str(config) == "3 adults"
-
-    def test_str_with_children(self):
-        """Test string format with children."""
-        config = PassengerConfig(adults=2, children=2)
-        assert str(config) == "2 adults, 2 children"
-
-    def test_str_with_single_child(self):
-        """Test string format with single child."""
-        config = PassengerConfig(adults=2, children=1)
-        assert str(config) == "2 adults, 1 child"
-
-    def test_str_with_infants(self):
-        """Test string format with infants."""
-        config = PassengerConfig(adults=2, infants=2)
-        assert str(config) == "2 adults, 2 infants"
-
-    def test_str_with_single_infant(self):
-        """Test string format with single infant."""
-        config = PassengerConfig(adults=1, infants=1)
-        assert str(config) == "1 adult, 1 infant"
-
-    def test_str_with_all_types(self):
-        """Test string format with all passenger types."""
-        config = PassengerConfig(adults=2, children=2, infants=1)
-        assert str(config) == "2 adults, 2 children, 1 infant"
+    @pytest.mark.parametrize(
+        "adults,children,infants,expected",
+        [
+            (1, 0, 0, "1 adult"),
+            (3, 0, 0, "3 adults"),
+            (2, 2, 0, "2 adults, 2 children"),
+            (2, 1, 0, "2 adults, 1 child"),
+            (2, 0, 2, "2 adults, 2 infants"),
+            (1, 0, 1, "1 adult, 1 infant"),
+            (2, 2, 1, "2 adults, 2 children, 1 infant"),
+        ],
+    )
+    def test_str_format(self, adults, children, infants, expected):
+        """Test string format pluralizes and omits zero counts."""
+        config = PassengerConfig(adults=adults, children=children, infants=infants)
+        assert str(config) == expected
 
 
 class TestPassengerConfigRealWorld:
@@ -23,7 +23,7 @@ from flight_finder.domain.common.result import (
 )
 
 
-class TestError(Exception):
+class FakeError(Exception):
     """Test exception for testing."""
 
     pass
@@ -35,6 +35,11 @@ class OtherError(Exception):
     pass
 
 
+# Results are frozen, so read-only tests share one error and its Err wrapper
+SENTINEL_ERR = FakeError("test")
+SENTINEL_ERR_RESULT: Result[int, FakeError] = Err(SENTINEL_ERR)
+
+
 class TestOk:
     """Tests for Ok variant."""
 
@@ -72,19 +77,19 @@ class TestErr:
 
     def test_err_creation(self) -> None:
         """Test creating an Err result."""
-        error = TestError("test error")
-        result: Result[int, TestError] = Err(error)
+        error = FakeError("test error")
+        result: Result[int, FakeError] = Err(error)
         assert isinstance(result, Err)
         assert result.error is error
 
     def test_err_is_ok(self) -> None:
         """Test is_ok returns False for Err."""
-        result: Result[int, TestError] = Err(TestError("test"))
+        result = SENTINEL_ERR_RESULT
         assert result.is_ok() is False
 
     def test_err_is_err(self) -> None:
         """Test is_err returns True for Err."""
-        result: Result[int, TestError] = Err(TestError("test"))
+        result = SENTINEL_ERR_RESULT
         assert result.is_err() is True
 
 
@@ -98,9 +103,9 @@ class TestUnwrap:
 
     def test_unwrap_err_raises(self) -> None:
         """Test unwrap raises error for Err."""
-        error = TestError("test error")
-        result: Result[int, TestError] = Err(error)
-        with pytest.raises(TestError, match="test error"):
+        error = FakeError("test error")
+        result: Result[int, FakeError] = Err(error)
+        with pytest.raises(FakeError, match="test error"):
             unwrap(result)
 
     def test_unwrap_or_ok(self) -> None:
@@ -110,7 +115,7 @@ class TestUnwrap:
 
     def test_unwrap_or_err(self) -> None:
         """Test unwrap_or returns default for Err."""
-        result: Result[int, TestError] = Err(TestError("test"))
+        result = SENTINEL_ERR_RESULT
         assert unwrap_or(result, 0) == 0
 
     def test_unwrap_or_else_ok(self) -> None:
@@ -120,7 +125,7 @@ class TestUnwrap:
 
     def test_unwrap_or_else_err(self) -> None:
         """Test unwrap_or_else computes default for Err."""
-        result: Result[int, TestError] = Err(TestError("test"))
+        result = SENTINEL_ERR_RESULT
         assert unwrap_or_else(result, lambda e: len(str(e))) > 0
 
 
@@ -136,11 +141,9 @@ class TestMapResult:
 
     def test_map_err_unchanged(self) -> None:
         """Test map_result preserves Err."""
-        error = TestError("test")
-        result: Result[int, TestError] = Err(error)
-        mapped = map_result(result, lambda x: x * 2)
+        mapped = map_result(SENTINEL_ERR_RESULT, lambda x: x * 2)
         assert isinstance(mapped, Err)
-        assert mapped.error is error
+        assert mapped.error is SENTINEL_ERR
 
     def test_map_changes_type(self) -> None:
         """Test map_result can change the value type."""
@@ -154,7 +157,7 @@ class TestMapErr:
 
     def test_map_err_transforms_error(self) -> None:
         """Test map_err transforms Err."""
-        result: Result[int, TestError] = Err(TestError("test"))
+        result = SENTINEL_ERR_RESULT
         mapped = map_err(result, lambda e: OtherError(f"wrapped: {e}"))
         assert isinstance(mapped, Err)
         assert isinstance(mapped.error, OtherError)
@@ -162,7 +165,7 @@ class TestMapErr:
 
     def test_map_err_preserves_ok(self) -> None:
         """Test map_err preserves Ok."""
-        result: Result[int, TestError] = Ok(42)
+        result: Result[int, FakeError] = Ok(42)
         mapped = map_err(result, lambda e: OtherError(str(e)))
         assert isinstance(mapped, Ok)
         assert unwrap(mapped) == 42
@@ -179,17 +182,17 @@ class TestAndThen:
 
     def test_and_then_ok_returns_err(self) -> None:
         """Test and_then can produce Err from Ok."""
-        result: Result[int, TestError] = Ok(42)
-        chained = and_then(result, lambda _: Err(TestError("failed")))
+        result: Result[int, FakeError] = Ok(42)
+        chained = and_then(result, lambda _: Err(FakeError("failed")))
         assert isinstance(chained, Err)
 
     def test_and_then_err_short_circuits(self) -> None:
         """Test and_then short-circuits on Err."""
-        error = TestError("original")
-        result: Result[int, TestError] = Err(error)
+        error = FakeError("original")
+        result: Result[int, FakeError] = Err(error)
         called = False
 
-        def should_not_call(x: int) -> Result[int, TestError]:
+        def should_not_call(x: int) -> Result[int, FakeError]:
             nonlocal called
             called = True
             return Ok(x)
@@ -205,19 +208,19 @@ class TestOrElse:
 
     def test_or_else_ok_unchanged(self) -> None:
         """Test or_else preserves Ok."""
-        result: Result[int, TestError] = Ok(42)
+        result: Result[int, FakeError] = Ok(42)
         recovered = or_else(result, lambda _: Ok(0))
         assert unwrap(recovered) == 42
 
     def test_or_else_err_recovers(self) -> None:
         """Test or_else recovers from Err."""
-        result: Result[int, TestError] = Err(TestError("test"))
+        result = SENTINEL_ERR_RESULT
         recovered = or_else(result, lambda _: Ok(0))
         assert unwrap(recovered) == 0
 
     def test_or_else_err_can_fail_again(self) -> None:
         """Test or_else can produce another Err."""
-        result: Result[int, TestError] = Err(TestError("first"))
+        result: Result[int, FakeError] = Err(FakeError("first"))
         recovered = or_else(result, lambda _: Err(OtherError("second")))
         assert isinstance(recovered, Err)
         assert isinstance(recovered.error, OtherError)
@@ -242,12 +245,12 @@ class TestCollectResults:
 
     def test_collect_first_err(self) -> None:
         """Test collecting returns first Err."""
-        error = TestError("first error")
-        results: list[Result[int, TestError]] = [
+        error = FakeError("first error")
+        results: list[Result[int, FakeError]] = [
             Ok(1),
             Err(error),
             Ok(3),
-            Err(TestError("second")),
+            Err(FakeError("second")),
         ]
         collected = collect_results(results)
         assert isinstance(collected, Err)
@@ -274,11 +277,11 @@ class TestFromException:
         """Test from_exception catches specified exceptions."""
 
         def raise_error() -> int:
-            raise TestError("test")
+            raise FakeError("test")
 
-        result = from_exception(raise_error, TestError)
+        result = from_exception(raise_error, FakeError)
         assert isinstance(result, Err)
-        assert isinstance(result.error, TestError)
+        assert isinstance(result.error, FakeError)
 
     def test_from_exception_catches_default(self) -> None:
         """Test from_exception catches Exception by default."""
@@ -319,11 +322,11 @@ class TestFromExceptionAsync:
         """Test from_exception_async catches exceptions."""
 
         async def async_raise() -> int:
-            raise TestError("async error")
+            raise FakeError("async error")
 
-        result = await from_exception_async(async_raise, TestError)
+        result = await from_exception_async(async_raise, FakeError)
         assert isinstance(result, Err)
-        assert isinstance(result.error, TestError)
+        assert isinstance(result.error, FakeError)
 
 
 class TestHelperFunctions:
@@ -332,12 +335,12 @@ class TestHelperFunctions:
     def test_is_ok_function(self) -> None:
         """Test is_ok function."""
         assert is_ok(Ok(42)) is True
-        assert is_ok(Err(TestError("test"))) is False
+        assert is_ok(SENTINEL_ERR_RESULT) is False
 
     def test_is_err_function(self) -> None:
         """Test is_err function."""
         assert is_err(Ok(42)) is False
-        assert is_err(Err(TestError("test"))) is True
+        assert is_err(SENTINEL_ERR_RESULT) is True
 
     def test_get_ok_returns_value(self) -> None:
         """Test get_ok returns value for Ok."""
@@ -345,13 +348,11 @@ class TestHelperFunctions:
 
     def test_get_ok_returns_none_for_err(self) -> None:
         """Test get_ok returns None for Err."""
-        assert get_ok(Err(TestError("test"))) is None
+        assert get_ok(SENTINEL_ERR_RESULT) is None
 
     def test_get_err_returns_error(self) -> None:
         """Test get_err returns error for Err."""
-        error = TestError("test")
-        result: Result[int, TestError] = Err(error)
-        assert get_err(result) is error
+        assert get_err(SENTINEL_ERR_RESULT) is SENTINEL_ERR
 
     def test_get_err_returns_none_for_ok(self) -> None:
         """Test get_err returns None for Ok."""
@@ -380,14 +381,14 @@ class TestResultComposition:
         """Test that chains short-circuit on first error."""
         call_count = 0
 
-        def increment_and_fail(x: int) -> Result[int, TestError]:
+        def increment_and_fail(x: int) -> Result[int, FakeError]:
             nonlocal call_count
             call_count += 1
             if x > 5:
-                return Err(TestError("too big"))
+                return Err(FakeError("too big"))
             return Ok(x + 1)
 
-        result: Result[int, TestError] = Ok(1)
+        result: Result[int, FakeError] = Ok(1)
 
         # Chain multiple operations, one will fail
         # Starts at 1, increments to 2, 3, 4, 5, 6
@@ -411,6 +412,6 @@ class TestResultImmutability:
 
     def test_err_is_frozen(self) -> None:
         """Test Err is immutable."""
-        result = Err(TestError("test"))
+        result = Err(FakeError("test"))
         with pytest.raises(AttributeError):
-            result.error = TestError("other")  # type: ignore[misc]
+            result.error = FakeError("other")  # type: ignore[misc]
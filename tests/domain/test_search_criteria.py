@@ -1,7 +1,11 @@
 """Unit tests for SearchCriteria entity."""
 
-import pytest
+from collections.abc import Callable
 from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
 
 from flight_finder.domain.entities.search_criteria import SearchCriteria
 from flight_finder.domain.value_objects.airport import Airport
@@ -9,19 +13,42 @@ from flight_finder.domain.value_objects.passenger_config import PassengerConfig
 from flight_finder.domain.value_objects.cabin_class import CabinClass, CabinClassType
 from flight_finder.domain.value_objects.date_range import DateRange
 
+# Airports are frozen, so every test shares the same instances
+JFK = Airport(code="JFK")
+LAX = Airport(code="LAX")
+LHR = Airport(code="LHR")
+SFO = Airport(code="SFO")
+SYD = Airport(code="SYD")
+
+
+@pytest.fixture
+def tomorrow() -> date:
+    return date.today() + timedelta(days=1)
+
+
+@pytest.fixture
+def next_week() -> date:
+    return date.today() + timedelta(days=7)
+
+
+@pytest.fixture
+def make_criteria(tomorrow: date) -> Callable[..., SearchCriteria]:
+    """Build a JFK-LAX search departing tomorrow, overriding only what a test needs."""
+
+    def make(**overrides: Any) -> SearchCriteria:
+        return SearchCriteria(
+            **{"origin": JFK, "destination": LAX, "departure_date": tomorrow, **overrides}
+        )
+
+    return make
+
 
 class TestSearchCriteriaValidation:
     """Test SearchCriteria validation rules."""
 
-    def test_create_valid_one_way_search(self):
+    def test_create_valid_one_way_search(self, make_criteria, tomorrow):
         """Test creating valid one-way search."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        criteria = make_criteria()
 
         assert criteria.origin.code == "JFK"
         assert criteria.destination.code == "LAX"
@@ -30,15 +57,13 @@ class TestSearchCriteriaValidation:
         assert criteria.is_one_way
         assert not criteria.is_round_trip
 
-    def test_create_valid_round_trip_search(self):
+    def test_create_valid_round_trip_search(self, make_criteria, next_week):
         """Test creating valid round-trip search."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure + timedelta(days=14)
+        return_date = next_week + timedelta(days=14)
 
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LHR"),
-            departure_date=departure,
+        criteria = make_criteria(
+            destination=LHR,
+            departure_date=next_week,
             return_date=return_date,
         )
 
@@ -46,148 +71,89 @@ class TestSearchCriteriaValidation:
         assert not criteria.is_one_way
         assert criteria.return_date == return_date
 
-    def test_departure_in_past_fails(self):
-        """Test that departure date in the past fails."""
-        yesterday = date.today() - timedelta(days=1)
-
-        with pytest.raises(ValueError, match="cannot be in the past"):
-            SearchCriteria(
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_date=yesterday,
-            )
-
-    def test_return_before_departure_fails(self):
-        """Test that return before departure fails."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure - timedelta(days=1)
-
-        with pytest.raises(ValueError, match="cannot be before departure"):
-            SearchCriteria(
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_date=departure,
-                return_date=return_date,
-            )
-
-    def test_same_origin_destination_fails(self):
-        """Test that same origin and destination fails."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        with pytest.raises(ValueError, match="cannot be the same"):
-            SearchCriteria(
-                origin=Airport(code="JFK"),
-                destination=Airport(code="JFK"),
-                departure_date=tomorrow,
-            )
-
-    def test_trip_duration_exceeds_one_year_fails(self):
-        """Test that trip duration > 1 year fails."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure + timedelta(days=400)
-
-        with pytest.raises(ValueError, match="exceeds 1 year"):
-            SearchCriteria(
-                origin=Airport(code="JFK"),
-                destination=Airport(code="SYD"),
-                departure_date=departure,
-                return_date=return_date,
-            )
-
-    def test_non_stop_with_max_stops_fails(self):
-        """Test that non_stop_only=True with max_stops > 0 fails."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        with pytest.raises(ValueError, match="Cannot specify max_stops"):
-            SearchCriteria(
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_date=tomorrow,
-                non_stop_only=True,
-                max_stops=2,
-            )
-
-    def test_immutability(self):
+    # Dates are given as day offsets from today and resolved inside the test
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            pytest.param(
+                {"departure_date": -1}, "cannot be in the past", id="departure_in_past"
+            ),
+            pytest.param(
+                {"departure_date": 7, "return_date": 6},
+                "cannot be before departure",
+                id="return_before_departure",
+            ),
+            pytest.param(
+                {"destination": JFK}, "cannot be the same", id="same_origin_destination"
+            ),
+            pytest.param(
+                {"destination": SYD, "departure_date": 7, "return_date": 407},
+                "exceeds 1 year",
+                id="trip_exceeds_one_year",
+            ),
+            pytest.param(
+                {"non_stop_only": True, "max_stops": 2},
+                "Cannot specify max_stops",
+                id="non_stop_with_max_stops",
+            ),
+        ],
+    )
+    def test_invalid_criteria_fails(self, make_criteria, overrides, match):
+        """Test that each broken search rule is rejected."""
+        today = date.today()
+        resolved = {
+            key: today + timedelta(days=value) if key.endswith("_date") else value
+            for key, value in overrides.items()
+        }
+
+        with pytest.raises(ValueError, match=match):
+            make_criteria(**resolved)
+
+    def test_immutability(self, make_criteria):
         """Test that SearchCriteria is immutable."""
-        tomorrow = date.today() + timedelta(days=1)
+        criteria = make_criteria()
 
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
-
-        with pytest.raises(Exception):  # Pydantic raises ValidationError or AttributeError
+        with pytest.raises(ValidationError):  # Frozen model rejects assignment
             criteria.departure_date = date.today()
 
 
 class TestSearchCriteriaWithPassengers:
     """Test SearchCriteria with different passenger configurations."""
 
-    def test_default_passenger_config(self):
+    def test_default_passenger_config(self, make_criteria):
         """Test default passenger config (1 adult)."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        criteria = make_criteria()
 
         assert criteria.passengers.adults == 1
         assert criteria.passengers.children == 0
         assert criteria.passengers.infants == 0
 
-    def test_custom_passenger_config(self):
+    def test_custom_passenger_config(self, make_criteria):
         """Test custom passenger configuration."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-            passengers=PassengerConfig(adults=2, children=2, infants=1),
-        )
+        criteria = make_criteria(passengers=PassengerConfig(adults=2, children=2, infants=1))
 
         assert criteria.passengers.total_passengers == 5
 
-    def test_invalid_passenger_config_fails(self):
+    def test_invalid_passenger_config_fails(self, make_criteria):
         """Test that invalid passenger config fails."""
-        tomorrow = date.today() + timedelta(days=1)
-
         # Too many passengers
         with pytest.raises(ValueError):
-            SearchCriteria(
-                origin=Airport(code="JFK"),
-                destination=Airport(code="LAX"),
-                departure_date=tomorrow,
-                passengers=PassengerConfig(adults=5, children=5),
-            )
+            make_criteria(passengers=PassengerConfig(adults=5, children=5))
 
 
 class TestSearchCriteriaCabinClass:
     """Test SearchCriteria with cabin class."""
 
-    def test_default_cabin_class(self):
+    def test_default_cabin_class(self, make_criteria):
         """Test default cabin class (economy)."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        criteria = make_criteria()
 
         assert criteria.cabin_class.class_type == CabinClassType.ECONOMY
 
-    def test_custom_cabin_class(self):
+    def test_custom_cabin_class(self, make_criteria):
         """Test custom cabin class."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LHR"),
-            departure_date=tomorrow,
+        criteria = make_criteria(
+            destination=LHR,
             cabin_class=CabinClass(class_type=CabinClassType.BUSINESS),
         )
 
@@ -197,67 +163,37 @@ class TestSearchCriteriaCabinClass:
 class TestSearchCriteriaProperties:
     """Test SearchCriteria computed properties."""
 
-    def test_trip_duration_days_one_way(self):
+    def test_trip_duration_days_one_way(self, make_criteria):
         """Test trip_duration_days for one-way trip."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        criteria = make_criteria()
 
         assert criteria.trip_duration_days is None
 
-    def test_trip_duration_days_round_trip(self):
+    def test_trip_duration_days_round_trip(self, make_criteria, next_week):
         """Test trip_duration_days for round trip."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure + timedelta(days=14)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LHR"),
-            departure_date=departure,
-            return_date=return_date,
+        criteria = make_criteria(
+            destination=LHR,
+            departure_date=next_week,
+            return_date=next_week + timedelta(days=14),
         )
 
         assert criteria.trip_duration_days == 14
 
-    def test_effective_max_stops_non_stop_only(self):
+    def test_effective_max_stops_non_stop_only(self, make_criteria):
         """Test effective_max_stops when non_stop_only is True."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-            non_stop_only=True,
-        )
+        criteria = make_criteria(non_stop_only=True)
 
         assert criteria.effective_max_stops == 0
 
-    def test_effective_max_stops_with_max_stops(self):
+    def test_effective_max_stops_with_max_stops(self, make_criteria):
         """Test effective_max_stops with max_stops set."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-            max_stops=2,
-        )
+        criteria = make_criteria(max_stops=2)
 
         assert criteria.effective_max_stops == 2
 
-    def test_effective_max_stops_none(self):
+    def test_effective_max_stops_none(self, make_criteria):
         """Test effective_max_stops when not specified."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        criteria = make_criteria()
 
         assert criteria.effective_max_stops is None
 
@@ -265,29 +201,20 @@ class TestSearchCriteriaProperties:
 class TestSearchCriteriaFlexibleDates:
     """Test SearchCriteria flexible date functionality."""
 
-    def test_get_departure_date_range_not_flexible(self):
+    def test_get_departure_date_range_not_flexible(self, make_criteria, next_week):
         """Test departure date range when not flexible."""
-        departure = date.today() + timedelta(days=7)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=departure,
-            flexible_dates=False,
-        )
+        criteria = make_criteria(departure_date=next_week, flexible_dates=False)
 
         date_range = criteria.get_departure_date_range()
-        assert date_range.start_date == departure
-        assert date_range.end_date == departure
+        assert date_range.start_date == next_week
+        assert date_range.end_date == next_week
         assert date_range.is_single_day()
 
-    def test_get_departure_date_range_flexible(self):
+    def test_get_departure_date_range_flexible(self, make_criteria):
         """Test departure date range when flexible."""
         departure = date.today() + timedelta(days=10)
 
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
+        criteria = make_criteria(
             departure_date=departure,
             flexible_dates=True,
             date_flexibility_days=3,
@@ -301,42 +228,26 @@ class TestSearchCriteriaFlexibleDates:
         assert date_range.end_date == expected_end
         assert date_range.duration_days == 7
 
-    def test_get_departure_date_range_flexible_near_today(self):
+    def test_get_departure_date_range_flexible_near_today(self, make_criteria):
         """Test flexible departure date range doesn't go into past."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-            flexible_dates=True,
-            date_flexibility_days=3,
-        )
+        criteria = make_criteria(flexible_dates=True, date_flexibility_days=3)
 
         date_range = criteria.get_departure_date_range()
         assert date_range.start_date >= date.today()
 
-    def test_get_return_date_range_one_way(self):
+    def test_get_return_date_range_one_way(self, make_criteria):
         """Test return date range for one-way trip."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        criteria = make_criteria()
 
         assert criteria.get_return_date_range() is None
 
-    def test_get_return_date_range_not_flexible(self):
+    def test_get_return_date_range_not_flexible(self, make_criteria, next_week):
         """Test return date range when not flexible."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure + timedelta(days=14)
+        return_date = next_week + timedelta(days=14)
 
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LHR"),
-            departure_date=departure,
+        criteria = make_criteria(
+            destination=LHR,
+            departure_date=next_week,
             return_date=return_date,
             flexible_dates=False,
         )
@@ -346,15 +257,13 @@ class TestSearchCriteriaFlexibleDates:
         assert date_range.start_date == return_date
         assert date_range.end_date == return_date
 
-    def test_get_return_date_range_flexible(self):
+    def test_get_return_date_range_flexible(self, make_criteria, next_week):
         """Test return date range when flexible."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure + timedelta(days=14)
+        return_date = next_week + timedelta(days=14)
 
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LHR"),
-            departure_date=departure,
+        criteria = make_criteria(
+            destination=LHR,
+            departure_date=next_week,
             return_date=return_date,
             flexible_dates=True,
             date_flexibility_days=2,
@@ -372,31 +281,20 @@ class TestSearchCriteriaFlexibleDates:
 class TestSearchCriteriaFormatting:
     """Test SearchCriteria string formatting."""
 
-    def test_str_one_way(self):
+    def test_str_one_way(self, make_criteria):
         """Test string format for one-way trip."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-        )
+        result = str(make_criteria())
 
-        result = str(criteria)
         assert "One-way" in result
         assert "JFK" in result
         assert "LAX" in result
 
-    def test_str_round_trip(self):
+    def test_str_round_trip(self, make_criteria, next_week):
         """Test string format for round trip."""
-        departure = date.today() + timedelta(days=7)
-        return_date = departure + timedelta(days=14)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LHR"),
-            departure_date=departure,
-            return_date=return_date,
+        criteria = make_criteria(
+            destination=LHR,
+            departure_date=next_week,
+            return_date=next_week + timedelta(days=14),
         )
 
         result = str(criteria)
@@ -404,30 +302,14 @@ class TestSearchCriteriaFormatting:
         assert "JFK" in result
         assert "LHR" in result
 
-    def test_str_with_non_stop_only(self):
+    def test_str_with_non_stop_only(self, make_criteria):
         """Test string format with non-stop only."""
-        tomorrow = date.today() + timedelta(days=1)
-
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="LAX"),
-            departure_date=tomorrow,
-            non_stop_only=True,
-        )
+        result = str(make_criteria(non_stop_only=True))
 
-        result = str(criteria)
         assert "non-stop only" in result
 
-    def test_str_with_max_stops(self):
+    def test_str_with_max_stops(self, make_criteria):
         """Test string format with max stops."""
-        tomorrow = date.today() + timedelta(days=1)
+        result = str(make_criteria(destination=SFO, max_stops=1))
 
-        criteria = SearchCriteria(
-            origin=Airport(code="JFK"),
-            destination=Airport(code="SFO"),
-            departure_date=tomorrow,
-            max_stops=1,
-        )
-
-        result = str(criteria)
         assert "max 1 stops" in result
@@ -50,6 +50,40 @@ class TestAsyncHTTPClient:
 
         await client.close()
 
+    @pytest.mark.anyio
+    async def test_get_json_parses_body(self) -> None:
+        client = AsyncHTTPClient()
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.content = b'{"status": true, "data": {"itineraries": [1, 2]}}'
+
+        with patch.object(client, "_ensure_client") as mock_ensure:
+            mock_http_client = AsyncMock()
+            mock_http_client.request = AsyncMock(return_value=mock_response)
+            mock_ensure.return_value = mock_http_client
+
+            data = await client.get_json("https://example.com")
+
+        assert data == {"status": True, "data": {"itineraries": [1, 2]}}
+        mock_response.raise_for_status.assert_called_once()
+        await client.close()
+
+    @pytest.mark.anyio
+    async def test_post_json_raises_on_error_status(self) -> None:
+        client = AsyncHTTPClient()
+        request = httpx.Request("POST", "https://example.com")
+        error_response = httpx.Response(400, request=request, content=b"{}")
+
+        with patch.object(client, "_ensure_client") as mock_ensure:
+            mock_http_client = AsyncMock()
+            mock_http_client.request = AsyncMock(return_value=error_response)
+            mock_ensure.return_value = mock_http_client
+
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.post_json("https://example.com", json={"key": "value"})
+
+        await client.close()
+
     @pytest.mark.anyio
     async def test_retry_on_timeout(self) -> None:
         config = RetryConfig(max_retries=2, min_wait_seconds=0.01, max_wait_seconds=0.05)
@@ -189,6 +223,21 @@ class TestAsyncHTTPClient:
             assert not client._client.is_closed
         assert client._client is None
 
+    @pytest.mark.anyio
+    async def test_client_reused_with_pool_limits(self) -> None:
+        client = AsyncHTTPClient(max_connections=8, max_keepalive_connections=4)
+        with patch.object(httpx, "AsyncClient", wraps=httpx.AsyncClient) as mock_cls:
+            first = await client._ensure_client()
+            second = await client._ensure_client()
+
+        assert first is second
+        mock_cls.assert_called_once()
+        limits = mock_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 4
+        assert mock_cls.call_args.kwargs["timeout"].connect == client.connect_timeout
+        await client.close()
+
     @pytest.mark.anyio
     async def test_close_is_idempotent(self) -> None:
         client = AsyncHTTPClient()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from flight_finder.domain.value_objects.cabin_class import CabinClass
+from flight_finder.infrastructure.providers.kiwi.response_mapper import KiwiResponseMapper
+
+
+def make_itinerary(itinerary_id: str = "1", price: object = None) -> dict:
+    return {
+        "id": itinerary_id,
+        "price": {"amount": "199.50"} if price is None else price,
+        "sector": {
+            "sectorSegments": [
+                {
+                    "segment": {
+                        "source": {
+                            "station": {"code": "JFK", "name": "JFK"},
+                            "utcTimeIso": "2026-06-01T10:00:00+00:00",
+                        },
+                        "destination": {
+                            "station": {"code": "LAX", "name": "LAX"},
+                            "utcTimeIso": "2026-06-01T16:00:00+00:00",
+                        },
+                        "carrier": {"code": "AA", "name": "American"},
+                        "code": "100",
+                    }
+                }
+            ]
+        },
+    }
+
+
+def test_malformed_itineraries_are_skipped_individually():
+    api_data = {
+        "data": {
+            "itineraries": [
+                make_itinerary("bad-price-type", price="199.50"),
+                make_itinerary("bad-price-list", price=[]),
+                make_itinerary("no-amount", price={"currency": "USD"}),
+                "not-an-itinerary",
+                make_itinerary("good"),
+            ]
+        }
+    }
+
+    flights = KiwiResponseMapper().map_api_response(api_data, CabinClass())
+
+    assert [f.id for f in flights] == ["kiwi_good"]
+    assert str(flights[0].price.amount) == "199.50"
@@ -33,7 +33,7 @@ class MockStructlog:
     BoundLogger = MockLogger
 
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
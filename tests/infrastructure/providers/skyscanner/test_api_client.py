@@ -26,7 +26,7 @@ class MockLogger:
 
 class MockStructlog:
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
@@ -87,6 +87,42 @@ class MockHTTPClient:
             return self.get_responses.pop(0)
         return MockResponse()
 
+    async def post_json(
+        self,
+        url: str,
+        *,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict:
+        response = await self.post(url, json=json, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict:
+        response = await self.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+
+class ConcurrencyTrackingHTTPClient(MockHTTPClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+
+    async def post(self, url: str, **kwargs: Any) -> MockResponse:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return MockResponse(status_code=200, _json_data={"sessionToken": "t", "status": "ok"})
+
 
 def make_search_criteria() -> SearchCriteria:
     return SearchCriteria(
@@ -165,6 +201,21 @@ async def test_poll_results_multiple_attempts():
     assert len(http_client.get_calls) == 3
 
 
+async def test_requests_are_serialized_per_client():
+    http_client = ConcurrencyTrackingHTTPClient()
+    client = SkyscannerAPIClient(api_key="test_key", http_client=http_client)
+
+    await asyncio.gather(*(client.create_session(make_search_criteria()) for _ in range(3)))
+
+    assert http_client.max_active == 1
+
+
+async def test_poll_delay_backs_off_with_cap():
+    for attempt, ceiling in ((1, 0.5), (2, 1.0), (3, 2.0), (4, 4.0), (10, 4.0)):
+        for _ in range(50):
+            assert 0 <= SkyscannerAPIClient._poll_delay(attempt) <= ceiling
+
+
 async def test_build_session_payload_one_way():
     http_client = MockHTTPClient()
     http_client.post_responses.append(
@@ -219,6 +270,12 @@ if __name__ == "__main__":
     asyncio.run(test_poll_results_multiple_attempts())
     print("[PASS] test_poll_results_multiple_attempts")
 
+    asyncio.run(test_requests_are_serialized_per_client())
+    print("[PASS] test_requests_are_serialized_per_client")
+
+    asyncio.run(test_poll_delay_backs_off_with_cap())
+    print("[PASS] test_poll_delay_backs_off_with_cap")
+
     asyncio.run(test_build_session_payload_one_way())
     print("[PASS] test_build_session_payload_one_way")
 
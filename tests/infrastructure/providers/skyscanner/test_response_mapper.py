@@ -26,7 +26,7 @@ class MockLogger:
 
 class MockStructlog:
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
@@ -81,6 +81,39 @@ def test_map_api_response_timestamps():
     assert flight.arrival_time > flight.departure_time
 
 
+def test_map_api_response_reuses_airports():
+    mapper = SkyscannerResponseMapper()
+    api_data = load_fixture("api_response.json")
+    cabin_class = CabinClass()
+
+    flights = mapper.map_api_response(api_data, cabin_class)
+
+    assert flights[0].origin is flights[1].origin
+    assert flights[0].destination is flights[1].destination
+
+
+def test_map_api_response_price_units():
+    mapper = SkyscannerResponseMapper()
+    cabin_class = CabinClass()
+
+    for raw_amount, expected in (
+        (29900, Decimal("299.00")),
+        ("29950", Decimal("299.50")),
+        ("45.50", Decimal("45.50")),
+        (99, Decimal("99")),
+        (45.5, Decimal("45.5")),
+    ):
+        api_data = load_fixture("api_response.json")
+        itineraries = api_data["content"]["results"]["itineraries"]
+        for itinerary in itineraries.values():
+            itinerary["pricingOptions"][0]["price"]["amount"] = raw_amount
+
+        flights = mapper.map_api_response(api_data, cabin_class)
+
+        assert flights
+        assert all(f.price.amount == expected for f in flights)
+
+
 def test_map_empty_response():
     mapper = SkyscannerResponseMapper()
     api_data = {"content": {"results": {"itineraries": {}}}}
@@ -141,6 +174,12 @@ if __name__ == "__main__":
     test_map_api_response_timestamps()
     print("[PASS] test_map_api_response_timestamps")
 
+    test_map_api_response_reuses_airports()
+    print("[PASS] test_map_api_response_reuses_airports")
+
+    test_map_api_response_price_units()
+    print("[PASS] test_map_api_response_price_units")
+
     test_map_empty_response()
     print("[PASS] test_map_empty_response")
 
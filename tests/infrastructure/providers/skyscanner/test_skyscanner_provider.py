@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import gc
 import sys
 from dataclasses import dataclass, field
 from datetime import date, timedelta
@@ -27,7 +28,7 @@ class MockLogger:
 
 class MockStructlog:
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
@@ -40,6 +41,7 @@ from flight_finder.domain.value_objects.airport import Airport
 from flight_finder.domain.value_objects.cabin_class import CabinClass
 from flight_finder.domain.value_objects.passenger_config import PassengerConfig
 from flight_finder.infrastructure.providers.skyscanner import SkyscannerProvider
+from flight_finder.infrastructure.providers.skyscanner.skyscanner_provider import SearchStats
 
 
 @dataclass
@@ -88,6 +90,44 @@ class MockHTTPClient:
             return self.responses.pop(0)
         return MockResponse()
 
+    async def post_json(
+        self,
+        url: str,
+        *,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict:
+        response = await self.post(url, json=json, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict:
+        response = await self.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+
+class YieldingHTTPClient(MockHTTPClient):
+    async def post(self, url: str, **kwargs: Any) -> MockResponse:
+        await asyncio.sleep(0)
+        return await super().post(url, **kwargs)
+
+
+class FailingHTTPClient(MockHTTPClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def post(self, url: str, **kwargs: Any) -> MockResponse:
+        await self.release.wait()
+        raise RuntimeError("upstream down")
+
 
 class MockRateLimiter:
     async def acquire(self) -> None:
@@ -289,6 +329,128 @@ async def test_provider_http_error():
     assert is_err(result)
 
 
+async def test_provider_retries_after_error():
+    http_client = MockHTTPClient()
+    http_client.responses.append(MockResponse(status_code=500, _json_data={}))
+    http_client.responses.append(
+        MockResponse(status_code=200, _json_data={"sessionToken": "test_token", "status": "created"})
+    )
+    http_client.responses.append(MockResponse(status_code=200, _json_data=make_api_response()))
+
+    rate_limiter = MockRateLimiter()
+    provider = SkyscannerProvider(
+        api_key="test_key",
+        http_client=http_client,
+        rate_limiter=rate_limiter,
+    )
+
+    criteria = make_search_criteria()
+    assert is_err(await provider.search(criteria))
+    assert is_ok(await provider.search(criteria))
+    assert len(http_client.calls) == 3
+
+
+async def test_concurrent_identical_searches_share_one_session():
+    http_client = YieldingHTTPClient()
+    http_client.responses.append(
+        MockResponse(status_code=200, _json_data={"sessionToken": "test_token", "status": "created"})
+    )
+    http_client.responses.append(MockResponse(status_code=200, _json_data=make_api_response()))
+
+    rate_limiter = MockRateLimiter()
+    provider = SkyscannerProvider(
+        api_key="test_key",
+        http_client=http_client,
+        rate_limiter=rate_limiter,
+    )
+
+    criteria = make_search_criteria()
+    results = await asyncio.gather(*(provider.search(criteria) for _ in range(3)))
+
+    assert all(is_ok(r) for r in results)
+    assert all(len(unwrap(r)) == 1 for r in results)
+    assert len(http_client.calls) == 2
+    assert provider._inflight == {}
+    assert provider.get_stats() == SearchStats(fetches=1, coalesced=2)
+
+
+async def test_failed_fetch_after_all_callers_cancelled_is_retrieved():
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict] = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    try:
+        http_client = FailingHTTPClient()
+        provider = SkyscannerProvider(
+            api_key="test_key",
+            http_client=http_client,
+            rate_limiter=MockRateLimiter(),
+        )
+
+        caller = asyncio.ensure_future(provider.search(make_search_criteria()))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+
+        http_client.release.set()
+        while provider._inflight:
+            await asyncio.sleep(0)
+        del caller
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert unhandled == []
+
+
+async def test_empty_results_use_short_ttl():
+    http_client = MockHTTPClient()
+    http_client.responses.append(
+        MockResponse(status_code=200, _json_data={"sessionToken": "test_token", "status": "created"})
+    )
+    http_client.responses.append(MockResponse(status_code=200, _json_data=make_api_response()))
+    provider = SkyscannerProvider(
+        api_key="test_key",
+        http_client=http_client,
+        rate_limiter=MockRateLimiter(),
+    )
+
+    criteria = make_search_criteria()
+    flights = unwrap(await provider.search(criteria))
+
+    assert provider.cache_ttl(criteria, []) < provider.cache_ttl(criteria, flights)
+
+
+async def test_cache_ttl_is_capped():
+    http_client = MockHTTPClient()
+    http_client.responses.append(
+        MockResponse(status_code=200, _json_data={"sessionToken": "test_token", "status": "created"})
+    )
+    http_client.responses.append(MockResponse(status_code=200, _json_data=make_api_response()))
+    provider = SkyscannerProvider(
+        api_key="test_key",
+        http_client=http_client,
+        rate_limiter=MockRateLimiter(),
+        max_cache_ttl_seconds=900,
+    )
+    far_out = make_search_criteria().model_copy(
+        update={"departure_date": date.today() + timedelta(days=90)}
+    )
+    flights = unwrap(await provider.search(far_out))
+
+    assert SkyscannerProvider._derive_ttl(far_out.departure_date) > 900
+    assert provider.cache_ttl(far_out, flights) == 900
+
+
+async def test_cache_ttl_shrinks_near_departure():
+    today = date.today()
+    derive_ttl = SkyscannerProvider._derive_ttl
+
+    assert derive_ttl(today) < derive_ttl(today + timedelta(days=3))
+    assert derive_ttl(today + timedelta(days=3)) < derive_ttl(today + timedelta(days=14))
+    assert derive_ttl(today + timedelta(days=14)) < derive_ttl(today + timedelta(days=90))
+
+
 if __name__ == "__main__":
     asyncio.run(test_provider_search_success())
     print("[PASS] test_provider_search_success")
@@ -305,4 +467,22 @@ if __name__ == "__main__":
     asyncio.run(test_provider_http_error())
     print("[PASS] test_provider_http_error")
 
+    asyncio.run(test_provider_retries_after_error())
+    print("[PASS] test_provider_retries_after_error")
+
+    asyncio.run(test_concurrent_identical_searches_share_one_session())
+    print("[PASS] test_concurrent_identical_searches_share_one_session")
+
+    asyncio.run(test_failed_fetch_after_all_callers_cancelled_is_retrieved())
+    print("[PASS] test_failed_fetch_after_all_callers_cancelled_is_retrieved")
+
+    asyncio.run(test_empty_results_use_short_ttl())
+    print("[PASS] test_empty_results_use_short_ttl")
+
+    asyncio.run(test_cache_ttl_is_capped())
+    print("[PASS] test_cache_ttl_is_capped")
+
+    asyncio.run(test_cache_ttl_shrinks_near_departure())
+    print("[PASS] test_cache_ttl_shrinks_near_departure")
+
     print("\nAll provider tests passed!")
@@ -24,7 +24,7 @@ class MockLogger:
 
 class MockStructlog:
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
@@ -156,6 +156,26 @@ async def test_cache_decorator_does_not_cache_errors():
     assert provider.search_count == 2
 
 
+async def test_cache_decorator_uses_ttl_policy():
+    flights = [make_test_flight()]
+    cache = InMemoryCache()
+    provider = MockProvider(flights=flights)
+    policy_calls = []
+
+    def expire_immediately(criteria, cached_flights):
+        policy_calls.append((criteria, cached_flights))
+        return 0
+
+    decorator = CacheDecorator(provider, cache, ttl_seconds=300, ttl_policy=expire_immediately)
+
+    criteria = make_test_criteria()
+    await decorator.search(criteria)
+    await decorator.search(criteria)
+
+    assert policy_calls == [(criteria, flights), (criteria, flights)]
+    assert provider.search_count == 2  # Policy TTL overrides ttl_seconds
+
+
 async def test_cache_decorator_is_available():
     cache = InMemoryCache()
     provider = MockProvider()
@@ -179,6 +199,9 @@ def run_tests():
     asyncio.run(test_cache_decorator_does_not_cache_errors())
     print("  ✓ test_cache_decorator_does_not_cache_errors")
 
+    asyncio.run(test_cache_decorator_uses_ttl_policy())
+    print("  ✓ test_cache_decorator_uses_ttl_policy")
+
     asyncio.run(test_cache_decorator_is_available())
     print("  ✓ test_cache_decorator_is_available")
 
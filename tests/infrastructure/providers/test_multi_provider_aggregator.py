@@ -24,14 +24,14 @@ class MockLogger:
 
 class MockStructlog:
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
 sys.modules["structlog"] = MockStructlog()
 
 import asyncio
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 
 from flight_finder.domain.common.result import Err, Ok, is_ok, unwrap
@@ -46,6 +46,9 @@ from flight_finder.infrastructure.providers.multi_provider_aggregator import (
     MultiProviderAggregator,
 )
 
+# Midnight anchor keeps the minute-level offsets below inside fixed dedup time buckets
+BASE_TIME = datetime.combine(date.today() + timedelta(days=30), time.min)
+
 
 class MockProvider:
     def __init__(
@@ -71,7 +74,7 @@ def make_test_flight(
     airline: str = "AA",
     dep_offset_hours: float = 0,
 ) -> Flight:
-    base_time = datetime.now() + timedelta(days=30)
+    base_time = BASE_TIME
     dep_time = base_time + timedelta(hours=10 + dep_offset_hours)
     arr_time = dep_time + timedelta(hours=5)
     return Flight(
@@ -191,7 +194,7 @@ async def test_results_sorted_by_price():
 
 async def test_deduplication_removes_similar_flights():
     # Create two similar flights (same airline, similar times, similar price)
-    base_time = datetime.now() + timedelta(days=30)
+    base_time = BASE_TIME
     dep_time = base_time + timedelta(hours=10)
     arr_time = dep_time + timedelta(hours=5)
 
@@ -234,7 +237,7 @@ async def test_deduplication_removes_similar_flights():
 
 
 async def test_different_airlines_not_deduplicated():
-    base_time = datetime.now() + timedelta(days=30)
+    base_time = BASE_TIME
     dep_time = base_time + timedelta(hours=10)
     arr_time = dep_time + timedelta(hours=5)
 
@@ -275,6 +278,23 @@ async def test_different_airlines_not_deduplicated():
     assert len(all_flights) == 2
 
 
+async def test_deduplication_across_interleaved_airlines():
+    aa_first = make_test_flight(flight_id="aa-1", airline="AA")
+    dl = make_test_flight(flight_id="dl-1", airline="DL")
+    ua = make_test_flight(flight_id="ua-1", airline="UA")
+    aa_second = make_test_flight(flight_id="aa-2", airline="AA", price=Decimal("301.00"))
+
+    provider1 = MockProvider("provider1", flights=[aa_first, dl, ua])
+    provider2 = MockProvider("provider2", flights=[aa_second])
+    aggregator = MultiProviderAggregator([provider1, provider2])
+
+    result = await aggregator.search(make_test_criteria())
+
+    assert is_ok(result)
+    ids = {f.id for f in unwrap(result)}
+    assert ids == {"aa-1", "dl-1", "ua-1"}
+
+
 def run_tests():
     print("Testing MultiProviderAggregator...")
 
@@ -302,6 +322,9 @@ def run_tests():
     asyncio.run(test_different_airlines_not_deduplicated())
     print("  ✓ test_different_airlines_not_deduplicated")
 
+    asyncio.run(test_deduplication_across_interleaved_airlines())
+    print("  ✓ test_deduplication_across_interleaved_airlines")
+
     print("\nAll MultiProviderAggregator tests passed!")
 
 
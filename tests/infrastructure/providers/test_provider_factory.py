@@ -25,7 +25,7 @@ class MockLogger:
 
 class MockStructlog:
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
@@ -44,6 +44,9 @@ from flight_finder.infrastructure.providers.provider_factory import ProviderFact
 from flight_finder.infrastructure.providers.provider_registry import ProviderRegistry
 
 
+_SUITE_CACHE_ENABLED = os.environ.get("FLIGHT_FINDER_CACHE_ENABLED")
+
+
 def setup_env():
     """Clear settings cache and setup test environment."""
     get_settings.cache_clear()
@@ -51,6 +54,17 @@ def setup_env():
     os.environ.pop("FLIGHT_FINDER_SKYSCANNER_API_KEY", None)
     os.environ.pop("FLIGHT_FINDER_SEARCHAPI_KEY", None)
     os.environ.pop("FLIGHT_FINDER_RAPIDAPI_KEY", None)
+    # The suite disables caching; these tests check the decorator is applied
+    os.environ["FLIGHT_FINDER_CACHE_ENABLED"] = "true"
+
+
+def teardown_module():
+    """Restore the suite's cache setting for later modules."""
+    if _SUITE_CACHE_ENABLED is None:
+        os.environ.pop("FLIGHT_FINDER_CACHE_ENABLED", None)
+    else:
+        os.environ["FLIGHT_FINDER_CACHE_ENABLED"] = _SUITE_CACHE_ENABLED
+    get_settings.cache_clear()
 
 
 def test_factory_creates_skyscanner_provider():
@@ -78,6 +92,20 @@ def test_factory_creates_skyscanner_with_cache():
     assert "cached" in provider.provider_name
 
 
+def test_factory_skips_cache_when_disabled():
+    setup_env()
+    os.environ["FLIGHT_FINDER_SKYSCANNER_API_KEY"] = "test-skyscanner-key"
+    os.environ["FLIGHT_FINDER_CACHE_ENABLED"] = "false"
+    get_settings.cache_clear()
+
+    factory = ProviderFactory()
+    provider = factory.create_skyscanner_provider(with_cache=True)
+
+    assert provider is not None
+    assert not isinstance(provider, CacheDecorator)
+    assert provider.provider_name == "skyscanner"
+
+
 def test_factory_returns_none_without_api_key():
     setup_env()
     get_settings.cache_clear()
@@ -204,6 +232,9 @@ def run_tests():
     test_factory_creates_skyscanner_with_cache()
     print("  ✓ test_factory_creates_skyscanner_with_cache")
 
+    test_factory_skips_cache_when_disabled()
+    print("  ✓ test_factory_skips_cache_when_disabled")
+
     test_factory_returns_none_without_api_key()
     print("  ✓ test_factory_returns_none_without_api_key")
 
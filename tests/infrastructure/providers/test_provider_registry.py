@@ -26,7 +26,7 @@ class MockStructlog:
     BoundLogger = MockLogger
 
     @staticmethod
-    def get_logger():
+    def get_logger(*args, **kwargs):
         return MockLogger()
 
 
@@ -0,0 +1,88 @@
+"""Tests for ProviderRegistry priority memoization and search_all."""
+
+from __future__ import annotations
+
+import asyncio
+
+from flight_finder.domain.common.result import Ok, is_err, is_ok
+from flight_finder.infrastructure.providers.provider_registry import ProviderRegistry
+
+
+class NamedProvider:
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def provider_name(self) -> str:
+        return self._name
+
+
+class Barrier:
+    def __init__(self, parties: int) -> None:
+        self._parties = parties
+        self._arrived = 0
+        self._released = asyncio.Event()
+
+    async def wait(self) -> None:
+        self._arrived += 1
+        if self._arrived == self._parties:
+            self._released.set()
+        await self._released.wait()
+
+
+class BarrierProvider(NamedProvider):
+    """Provider whose search only returns once every expected search has started."""
+
+    def __init__(self, name: str, barrier: Barrier, fail: bool = False) -> None:
+        super().__init__(name)
+        self._barrier = barrier
+        self._fail = fail
+        self.calls = 0
+
+    async def search(self, criteria):
+        self.calls += 1
+        await self._barrier.wait()
+        if self._fail:
+            raise RuntimeError("boom")
+        return Ok([])
+
+
+def test_priority_list_refreshed_after_changes():
+    registry = ProviderRegistry()
+    registry.register(NamedProvider("low"), priority=10)
+    registry.register(NamedProvider("high"), priority=90, enabled=False)
+
+    assert [p.provider_name for p in registry.get_by_priority()] == ["low"]
+
+    registry.enable("high")
+    registry.register(NamedProvider("mid"), priority=50)
+
+    assert [p.provider_name for p in registry.get_by_priority()] == ["high", "mid", "low"]
+
+    registry.disable("mid")
+    # Callers get a copy, so mutating it must not corrupt the memoized list
+    registry.get_by_priority().clear()
+
+    assert [p.provider_name for p in registry.get_by_priority()] == ["high", "low"]
+
+
+async def test_search_all_runs_enabled_providers_concurrently():
+    # Each search blocks until both enabled searches are in flight, so a
+    # sequential implementation never gets past the first provider.
+    barrier = Barrier(parties=2)
+    ok = BarrierProvider("a", barrier)
+    failing = BarrierProvider("b", barrier, fail=True)
+    disabled = BarrierProvider("c", barrier)
+
+    registry = ProviderRegistry()
+    registry.register(ok)
+    registry.register(failing)
+    registry.register(disabled, enabled=False)
+
+    results = await asyncio.wait_for(registry.search_all(criteria=None), timeout=5)
+
+    assert set(results) == {"a", "b"}
+    assert is_ok(results["a"])
+    assert is_err(results["b"])
+    assert results["b"].error.provider == "b"
+    assert disabled.calls == 0
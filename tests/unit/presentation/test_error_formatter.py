@@ -0,0 +1,60 @@
+"""Tests for error response formatting."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from flight_finder.domain.errors.domain_errors import DomainError
+from flight_finder.presentation.utils.error_formatter import format_error_response
+
+
+class Color(Enum):
+    RED = 1
+
+
+class TestFormatErrorResponse:
+    """Tests for format_error_response."""
+
+    def test_context_values_are_encoded(self) -> None:
+        """Test that non-JSON context values and keys are encoded, not raised."""
+        error = DomainError(
+            "bad response",
+            context={
+                "amount": Decimal("299.90"),
+                "at": datetime(2026, 6, 1, 10, 30),
+                "color": Color.RED,
+                404: "status",
+                None: "missing",
+            },
+        )
+
+        payload = json.loads(format_error_response(error))
+
+        assert payload["success"] is False
+        assert payload["error"]["details"] == {
+            "amount": "299.90",
+            "at": "2026-06-01 10:30:00",
+            "color": 1,  # orjson encodes enums by value; json.dumps gave "Color.RED"
+            "404": "status",
+            "null": "missing",
+        }
+
+    def test_int_beyond_64_bits_is_encoded(self) -> None:
+        """Test that ints orjson cannot encode still render exactly."""
+        error = DomainError("overflow", context={"value": 2**70})
+
+        payload = json.loads(format_error_response(error))
+
+        assert payload["error"]["details"] == {"value": 2**70}
+
+    def test_unencodable_context_falls_back_to_internal_error(self) -> None:
+        """Test that a context neither encoder accepts yields the internal error."""
+        error = DomainError("bad keys", context={(1, 2): "tuple key", "big": 2**70})
+
+        payload = json.loads(format_error_response(error))
+
+        assert payload == {
+            "success": False,
+            "error": {"code": "INTERNAL_ERROR", "message": "An unexpected error occurred"},
+        }
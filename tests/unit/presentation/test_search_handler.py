@@ -0,0 +1,137 @@
+"""Tests for the search handler's response encoding."""
+
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+from flight_finder.application.dtos.flight_dtos import FlightSearchResult
+from flight_finder.domain.common.result import Ok
+from flight_finder.domain.entities.flight import Flight
+from flight_finder.domain.value_objects.airport import Airport
+from flight_finder.domain.value_objects.price import Price
+from flight_finder.presentation.handlers.search_handler import (
+    _OFFLOAD_ENCODE_THRESHOLD,
+    SearchHandler,
+)
+from flight_finder.presentation.schemas.converters import flight_to_dict
+
+DEPARTURE = date.today() + timedelta(days=30)
+
+
+class StubSearchUseCase:
+    def __init__(self, search_result: FlightSearchResult) -> None:
+        self._search_result = search_result
+
+    async def execute(self, criteria: Any) -> Ok[FlightSearchResult]:
+        return Ok(self._search_result)
+
+
+def make_flight(index: int, amount: str, airline_name: str = "American Airlines") -> Flight:
+    departure = datetime.combine(DEPARTURE, datetime.min.time()) + timedelta(minutes=index)
+    return Flight(
+        id=f"flight-{index}",
+        origin=Airport(code="JFK"),
+        destination=Airport(code="LAX"),
+        departure_time=departure,
+        arrival_time=departure + timedelta(hours=5),
+        price=Price(amount=Decimal(amount)),
+        airline="AA",
+        airline_name=airline_name,
+    )
+
+
+def expected_response(search_result: FlightSearchResult) -> str:
+    """The response as previously built: one dict encoded with OPT_INDENT_2."""
+    prices = [f.price.amount for f in search_result.flights]
+    min_price = min(prices) if prices else None
+    max_price = max(prices) if prices else None
+    payload = {
+        "success": True,
+        "summary": {
+            "total_flights": search_result.total_results,
+            "search_duration_ms": round(search_result.search_duration_ms, 2),
+            "providers_used": search_result.providers_used,
+            "cache_hit": search_result.cache_hit,
+            "price_range": {
+                "min": str(min_price) if min_price else None,
+                "max": str(max_price) if max_price else None,
+            },
+        },
+        "flights": [flight_to_dict(f) for f in search_result.flights],
+    }
+    return orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
+async def search(search_result: FlightSearchResult) -> str:
+    handler = SearchHandler(StubSearchUseCase(search_result))
+    return await handler.handle_search(
+        origin="JFK",
+        destination="LAX",
+        departure_date=DEPARTURE.isoformat(),
+    )
+
+
+class TestSearchResponseEncoding:
+    """The hand-laid success template must match a plain OPT_INDENT_2 encode."""
+
+    async def test_zero_flights(self) -> None:
+        """Test an empty result renders the same as the dict encode."""
+        search_result = FlightSearchResult(
+            flights=[], total_results=0, providers_used=["skyscanner"]
+        )
+
+        response = await search(search_result)
+
+        assert json.loads(response) == json.loads(expected_response(search_result))
+        assert response == expected_response(search_result)
+
+    async def test_a_few_flights(self) -> None:
+        """Test a short result renders the same as the dict encode."""
+        flights = [make_flight(0, "199.99"), make_flight(1, "349.50"), make_flight(2, "120.00")]
+        search_result = FlightSearchResult(
+            flights=flights,
+            total_results=len(flights),
+            providers_used=["skyscanner", "kiwi"],
+            search_duration_ms=812.3456,
+            cache_hit=True,
+        )
+
+        response = await search(search_result)
+
+        payload = json.loads(response)
+        assert payload == json.loads(expected_response(search_result))
+        assert payload["summary"]["price_range"] == {"min": "120.00", "max": "349.50"}
+        assert response == expected_response(search_result)
+
+    async def test_quotes_and_non_ascii_are_escaped(self) -> None:
+        """Test strings needing escapes stay valid JSON inside the template."""
+        flights = [make_flight(0, "99.00", airline_name='Aer "Lingus" \\ Øresund ✈')]
+        search_result = FlightSearchResult(
+            flights=flights,
+            total_results=1,
+            providers_used=['kiwi "beta"', "skyscanner\nø", "中国"],
+        )
+
+        response = await search(search_result)
+
+        payload = json.loads(response)
+        assert payload == json.loads(expected_response(search_result))
+        assert payload["summary"]["providers_used"] == ['kiwi "beta"', "skyscanner\nø", "中国"]
+        assert payload["flights"][0]["airline_name"] == 'Aer "Lingus" \\ Øresund ✈'
+        assert response == expected_response(search_result)
+
+    async def test_large_result_is_encoded_in_order(self) -> None:
+        """Test results past the worker-thread threshold keep input order."""
+        flights = [make_flight(i, f"{500 - i}.00") for i in range(75)]
+        search_result = FlightSearchResult(flights=flights, total_results=len(flights))
+        assert len(flights) > _OFFLOAD_ENCODE_THRESHOLD
+
+        response = await search(search_result)
+
+        payload = json.loads(response)
+        assert [f["id"] for f in payload["flights"]] == [f.id for f in flights]
+        assert payload["summary"]["price_range"] == {"min": "426.00", "max": "500.00"}
+        assert response == expected_response(search_result)
@@ -1,10 +1,14 @@
 """Tests for configuration module."""
 
+import io
+import json
 import os
+import sys
 from unittest.mock import patch
 
 import pytest
 
+from flight_finder.config import logging_config
 from flight_finder.config.settings import Settings, get_settings
 
 
@@ -94,3 +98,22 @@ class TestGetSettings:
         settings1 = get_settings()
         settings2 = get_settings()
         assert settings1 is settings2
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging."""
+
+    def test_json_logging_without_binary_stderr(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that JSON logs fall back to str output when stderr has no buffer."""
+        structlog = logging_config.structlog
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", stream)
+        try:
+            logging_config.configure_logging(level="INFO", log_format="json")
+            structlog.get_logger().info("fallback_check", value=1)
+        finally:
+            structlog.reset_defaults()
+
+        record = json.loads(stream.getvalue())
+        assert record["event"] == "fallback_check"
+        assert record["value"] == 1